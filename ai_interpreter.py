@@ -3,8 +3,11 @@ AI Интерпретатор за астрологични карти
 Използва Together.ai API за анализ и интерпретация
 """
 
+import asyncio
+import logging
 import os
-import json
+import orjson
+import threading
 from typing import Dict, Optional, List, Tuple
 from collections import defaultdict
 import httpx
@@ -15,6 +18,8 @@ from aspects_engine import calculate_natal_aspects
 # Зареждане на environment променливи
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Шаблони за различни типове доклади
 PROMPT_TEMPLATES = {
     "general": """
@@ -1224,6 +1229,156 @@ DYNAMIC_PROMPT_TEMPLATES = {
 }
 
 
+def _to_prompt_json(data) -> str:
+    """
+    Сериализира данни за prompt-а към AI в един orjson проход.
+    
+    Форматът съвпада с json.dumps(data, indent=2, ensure_ascii=False).
+    
+    Args:
+        data: Речник или списък с данни (карта, аспекти, събития)
+        
+    Returns:
+        JSON string с отстъп от 2 интервала
+    """
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+# Финални инструкции за статичния режим (изграждат се веднъж при import)
+STATIC_MODE_INSTRUCTIONS = {
+    # Money анализ
+    "money": (
+        "\n*** CRITICAL INSTRUCTIONS FOR MONEY ANALYSIS ***\n"
+        "1. **HOUSE RULERS ARE ALREADY CALCULATED** - Do NOT recalculate them from house cusp longitudes.\n"
+        "2. **USE HOUSE RULERS FROM CONTEXT** - The system prompt provides the rulers (e.g., 'Money Ruler (2nd House): Sun').\n"
+        "3. **TO FIND HOUSE CUSP SIGNS**: Look in the 'houses' object - use the 'formatted_pos' or convert the cusp longitude to sign using _decimal_to_dms logic (but prefer using provided house ruler info).\n"
+        "4. **TO FIND WHERE THE RULER IS**: Look in the 'planets' object for the ruler planet (e.g., if ruler is 'Sun', find 'Sun' in planets and see its 'house' field).\n"
+        "5. **EXAMPLE CORRECT LOGIC**:\n"
+        "   - System says: 'Money Ruler (2nd House): Sun'\n"
+        "   - In planets JSON, find 'Sun' → see it has 'house': 10 and 'zodiac_sign': 'Aries'\n"
+        "   - Therefore: '2nd House is ruled by Sun. Sun is in Aries in 10th House → Money comes through career/public role'\n"
+        "6. **DO NOT**: Say '2nd House is in Aries' or calculate house cusp signs incorrectly from longitude.\n"
+        "7. **ALWAYS USE MODERN RULERS**: Uranus for Aquarius, Neptune for Pisces, Pluto for Scorpio.\n"
+        "8. **FOCUS ON**: Position of the ruler (which house and sign it's in) - this shows HOW money is generated.\n\n"
+    ),
+    # Love анализ със synastry overlays
+    "love_synastry": (
+        "\n*** ⚠️ CRITICAL INSTRUCTIONS FOR LOVE ANALYSIS (SYNASTRY MODE) - MANDATORY ***\n"
+        "1. **PARTNER HOUSE OVERLAYS ARE PRE-CALCULATED** - Look at 'PARTNER PLANETS IN USER'S NATAL HOUSES (CALCULATED)' section above.\n"
+        "2. **USE EXACT NUMBERS FROM OVERLAY DATA** - If it shows {'Sun': 8}, say 'User's 8th house' (NOT 9th, NOT 2nd, NOT any other number).\n"
+        "3. **ALWAYS SAY 'User's [X]th house'** - Never say just '[X]th house' without 'User's' prefix to avoid confusion.\n"
+        "4. **FORBIDDEN EXAMPLES** - Never say:\n"
+        "   - 'Partner's Sun in 9th house' if overlay shows 8\n"
+        "   - 'Partner's Mars in 4th house' if overlay shows 12\n"
+        "   - 'Partner's Sun in 2nd house' (referring to Partner's own chart)\n"
+        "5. **CORRECT EXAMPLES** - Always say:\n"
+        "   - 'Partner's Sun is in User's 8th house' (if overlay shows 'Sun': 8)\n"
+        "   - 'Partner's Moon is in User's 1st house' (if overlay shows 'Moon': 1)\n"
+        "   - 'Partner's Venus is in User's 8th house' (if overlay shows 'Venus': 8)\n"
+        "   - 'Partner's Mars is in User's 12th house' (if overlay shows 'Mars': 12)\n"
+        "6. **HOUSE RULERS ARE ALREADY CALCULATED** - Use them from context (e.g., 'Love Ruler (7th House): Venus').\n"
+        "7. **DO NOT mention aspects** between planets unless they are explicitly provided in the chart data.\n\n"
+    ),
+    # Synastry без транзити (плейсхолдъри: user_display_name, partner_display_name)
+    "synastry": (
+        "Please provide a comprehensive SYNASTRY analysis covering:\n\n"
+        "1. NO ASPECT CALCULATIONS:\n"
+        "   - The backend does NOT provide aspect data between charts.\n"
+        "   - **DO NOT mention any aspects** (conjunction, square, trine, etc.) between {user_display_name} and {partner_display_name}.\n"
+        "   - Focus ONLY on house overlays and natal chart interpretations.\n\n"
+        "2. HOUSE OVERLAYS:\n"
+        "   - The house placements are ALREADY CALCULATED in 'PARTNER PLANETS IN USER'S NATAL HOUSES (CALCULATED)'.\n"
+        "   - USE THESE PRE-CALCULATED HOUSE NUMBERS - DO NOT recalculate them.\n"
+        "   - How does {partner_display_name} impact {user_display_name}'s life goals (10th house) and emotional security (4th house)?\n"
+        "   - Analyze 1st house (identity), 5th house (romance), 7th house (partnership), 8th house (intimacy), 12th house (subconscious).\n\n"
+        "3. RELATIONSHIP AREAS:\n"
+        "   - Emotional connection (her Moon in your house, 4th house overlays)\n"
+        "   - Communication (her Mercury in your house, 3rd house overlays)\n"
+        "   - Sexual chemistry (her Venus/Mars in your 5th/8th/12th house overlays)\n"
+        "   - Long-term potential (Saturn in your houses, 7th/10th house overlays)\n\n"
+        "4. Use ONLY the 'formatted_pos' values provided. Do NOT calculate from raw longitude.\n"
+        "5. Do NOT predict the future or mention transits."
+    ),
+    # Натален анализ
+    "natal": (
+        "Please provide a comprehensive NATAL CHART analysis:\n"
+        "1. **PERSONALITY TRAITS:** Analyze personality traits based on planetary positions and signs.\n"
+        "2. **ASCENDANT (MANDATORY SECTION):** Analyze the Ascendant sign and degree in detail. Explain:\n"
+        "   - The outer mask and first impression the person creates\n"
+        "   - Physical appearance tendencies\n"
+        "   - How the Ascendant contrasts or harmonizes with the Sun sign\n"
+        "   - The person's initial reaction to the world and how they 'start' in life\n"
+        "   - Example: 'Ascendant in Cancer 14°22' - The Protective Shell: Despite the fiery Sun in Aries, your outer presentation is soft, caring, and intuitive. People see you as someone they can trust and rely on.'\n"
+        "3. Identify life themes and karmic patterns.\n"
+        "4. Explain strengths and challenges from aspects.\n"
+        "5. Describe house placements and their meanings.\n"
+        "6. Focus on psychological patterns and inner motivations.\n"
+        "7. Do NOT predict the future or mention transits.\n"
+        "8. Focus on the person's inherent nature and potential."
+    ),
+    # Synastry + транзитна прогноза (плейсхолдъри: user_display_name, partner_display_name)
+    "synastry_forecast": (
+        "Please provide a comprehensive SYNASTRY + FORECAST analysis:\n\n"
+        "1. SYNASTRY (Compatibility):\n"
+        "   - Compare {user_display_name}'s planets with {partner_display_name}'s planets.\n"
+        "   - Focus on Personal Planets (Sun, Moon, Mercury, Venus, Mars).\n"
+        "   - Identify Sun/Moon conjunctions (soulmate potential).\n"
+        "   - Identify Mars/Venus aspects (sexual chemistry).\n"
+        "   - House overlays: Use the PRE-CALCULATED house placements from 'PARTNER PLANETS IN USER'S NATAL HOUSES (CALCULATED)'.\n"
+        "   - DO NOT recalculate house positions - use the provided numbers.\n"
+        "   - How does {partner_display_name} impact {user_display_name}'s life goals (10th house) and emotional security (4th house)?\n\n"
+        "2. RELATIONSHIP FORECAST (with Transits):\n"
+        "   - Analyze transits to BOTH charts ({user_display_name} and {partner_display_name}).\n"
+        "   - Will they stay together? Is there a crisis or opportunity?\n"
+        "   - Use the PRE-CALCULATED transit house mappings from 'TRANSIT PLANETS IN USER'S NATAL HOUSES (CALCULATED)'.\n"
+        "   - Look for transiting planets activating relationship houses (7th house) or Venus/Mars.\n"
+        "   - Identify periods of harmony or tension.\n\n"
+        "3. RELATIONSHIP AREAS:\n"
+        "   - Emotional connection (Moon aspects, 4th house overlays)\n"
+        "   - Communication (Mercury aspects, 3rd house overlays)\n"
+        "   - Sexual chemistry (Mars/Venus aspects, 5th/8th house overlays)\n"
+        "   - Long-term potential (Saturn aspects, 7th/10th house overlays)\n\n"
+        "4. Use ONLY the 'formatted_pos' values provided. Do NOT calculate from raw longitude.\n"
+        "5. Be specific about dates, degrees, and aspects.\n"
+        "6. Focus on practical implications for the relationship."
+    ),
+    # Транзитна прогноза
+    "forecast": (
+        "Please provide a comprehensive FORECAST analysis:\n"
+        "1. Compare each transit planet's position to the natal chart.\n"
+        "2. Identify significant aspects between transit and natal planets.\n"
+        "3. Use the PRE-CALCULATED transit house mappings from 'TRANSIT PLANETS IN USER'S NATAL HOUSES (CALCULATED)'.\n"
+        "   DO NOT recalculate house positions - use the provided numbers.\n"
+        "4. Analyze potential for meeting a new partner (5th/7th house transits) if relevant.\n"
+        "5. Explain what these transits mean for the person at this specific date.\n"
+        "6. Be specific about dates, degrees, and aspects.\n"
+        "7. Focus on practical implications and timing."
+    )
+}
+
+
+# Максимален брой натални аспекти на партньора в prompt-а (най-точните по орб)
+PARTNER_ASPECTS_TOP_K = 30
+
+# Максимален брой едновременни заявки към AI при месечните прогнози (rate limit на доставчика)
+MONTHLY_CHUNK_CONCURRENCY = 4
+
+# Имена на месеците на български (индекс = номер на месеца)
+MONTH_NAMES_BG = (
+    "", "Януари", "Февруари", "Март", "Април", "Май", "Юни",
+    "Юли", "Август", "Септември", "Октомври", "Ноември", "Декември"
+)
+
+
+def format_month_bg(month_key: str) -> str:
+    """Форматира месец "YYYY-MM" за показване, напр. "2026-03" -> "Март 2026"."""
+    return f"{MONTH_NAMES_BG[int(month_key[5:7])]} {month_key[:4]}"
+
+
+# Полета от транзитната карта, които се подават на AI (без домовете)
+TRANSIT_PROMPT_KEYS = ("planets", "datetime_utc", "julian_day", "timezone", "datetime_local")
+
+
 class AIInterpreter:
     """Клас за AI интерпретация на астрологични карти"""
     
@@ -1304,6 +1459,21 @@ class AIInterpreter:
         
         return focus_instructions.get(report_type, focus_instructions["general"])
     
+    @staticmethod
+    def _transit_chart_json(transit_chart: Dict) -> str:
+        """
+        Сериализира транзитната карта без домовете.
+        
+        Args:
+            transit_chart: Речник с данни от транзитната карта
+            
+        Returns:
+            JSON string (indent=2) само с полетата от TRANSIT_PROMPT_KEYS
+        """
+        return _to_prompt_json(
+            {key: transit_chart[key] for key in TRANSIT_PROMPT_KEYS if key in transit_chart}
+        )
+    
     @staticmethod
     def _get_bulgarian_language_rules() -> str:
         """
@@ -1735,6 +1905,139 @@ class AIInterpreter:
         
         return f"{base_persona}{house_rulers_context}{partner_rulers_context}{context}{common_rules}{type_specific_examples}{question_instruction}{language_rules}"
     
+    def _build_monthly_context(
+        self,
+        report_type: str,
+        language: str,
+        natal_chart: Dict,
+        partner_chart: Optional[Dict],
+        user_display_name: str,
+        partner_display_name: str,
+        question: str,
+        has_partner: bool
+    ) -> str:
+        """
+        Изгражда статичната част на месечните prompt-ове: system prompt + натален контекст.
+        
+        Частта е еднаква за всички месеци в една прогноза, затова се изгражда веднъж
+        и стои в началото на заявката - Together.ai кешира повтарящия се префикс
+        и не го обработва наново за всеки месец.
+        
+        Returns:
+            System prompt, последван от наталните карти, аспектите и overlay-ите
+        """
+        # Ensure has_partner is properly set (defensive check)
+        has_partner_flag = bool(has_partner and partner_chart is not None)
+        
+        # Calculate house rulers for the natal chart
+        houses = natal_chart.get("houses", {})
+        house_rulers = self.engine.get_house_rulers(houses) if houses else {}
+        
+        # Calculate house rulers for partner chart if present
+        partner_house_rulers = None
+        if partner_chart:
+            partner_houses = partner_chart.get("houses", {})
+            partner_house_rulers = self.engine.get_house_rulers(partner_houses) if partner_houses else {}
+        
+        # Build system prompt
+        system_prompt = self._build_dynamic_system_prompt(
+            report_type=report_type,
+            language=language,
+            natal_chart=natal_chart,
+            partner_chart=partner_chart,
+            user_display_name=user_display_name,
+            partner_display_name=partner_display_name,
+            has_partner=has_partner_flag,
+            user_question=question,
+            house_rulers=house_rulers,
+            partner_house_rulers=partner_house_rulers
+        )
+        
+        context = f"{system_prompt}\n\n"
+        
+        if has_partner_flag:
+            natal_json = _to_prompt_json(natal_chart)
+            partner_json = _to_prompt_json(partner_chart)
+            context += f"--- {user_display_name.upper()} NATAL CHART ---\n{natal_json}\n\n"
+            
+            # Calculate natal aspects for user
+            try:
+                natal_aspects_user_monthly = calculate_natal_aspects(natal_chart, use_wider_orbs=False)
+                natal_aspects_user_monthly_json = _to_prompt_json(natal_aspects_user_monthly)
+                context += f"--- {user_display_name.upper()} NATAL ASPECTS (CALCULATED) ---\n"
+                context += "CRITICAL: These aspects are PRE-CALCULATED by the backend. Use them directly - DO NOT recalculate or assume aspects.\n"
+                context += f"{natal_aspects_user_monthly_json}\n\n"
+            except Exception as e:
+                print(f"Warning: Could not calculate user natal aspects for monthly chunk: {e}")
+            
+            context += f"--- {partner_display_name.upper()} NATAL CHART ---\n{partner_json}\n\n"
+            
+            # Calculate natal aspects for partner
+            try:
+                partner_natal_aspects_monthly = calculate_natal_aspects(partner_chart, use_wider_orbs=False, top_k=PARTNER_ASPECTS_TOP_K)
+                partner_natal_aspects_monthly_json = _to_prompt_json(partner_natal_aspects_monthly)
+                context += f"--- {partner_display_name.upper()} NATAL ASPECTS (CALCULATED) ---\n"
+                context += "CRITICAL: These aspects are PRE-CALCULATED by the backend. Use them directly - DO NOT recalculate or assume aspects.\n"
+                context += f"{partner_natal_aspects_monthly_json}\n\n"
+            except Exception as e:
+                print(f"Warning: Could not calculate partner natal aspects for monthly chunk: {e}")
+            
+            # Calculate synastry house overlays (Partner's planets in User's houses)
+            try:
+                partner_overlays = self.engine.calculate_synastry_house_overlays(
+                    user_natal_chart=natal_chart,
+                    partner_planets=partner_chart.get("planets", {})
+                )
+                partner_overlays_json = _to_prompt_json(partner_overlays)
+                context += f"--- PARTNER PLANETS IN USER'S NATAL HOUSES (CALCULATED) ---\n"
+                context += "CRITICAL: These house placements are PRE-CALCULATED by the backend using Placidus house system. Use them directly - DO NOT recalculate.\n"
+                context += "Each number represents which of User's houses the Partner's planet falls into.\n"
+                context += f"{partner_overlays_json}\n\n"
+            except Exception as e:
+                print(f"Warning: Could not calculate partner house overlays for monthly chunk: {e}")
+            
+            # Calculate reverse overlays (User's planets in Partner's houses) - for completeness
+            try:
+                user_overlays = self.engine.calculate_synastry_house_overlays(
+                    user_natal_chart=partner_chart,
+                    partner_planets=natal_chart.get("planets", {})
+                )
+                user_overlays_json = _to_prompt_json(user_overlays)
+                context += f"--- {user_display_name.upper()} PLANETS IN {partner_display_name.upper()}'S NATAL HOUSES (CALCULATED) ---\n"
+                context += "CRITICAL: These house placements are PRE-CALCULATED by the backend using Placidus house system. Use them directly - DO NOT recalculate.\n"
+                context += "Each number represents which of Partner's houses the User's planet falls into.\n"
+                context += f"{user_overlays_json}\n\n"
+            except Exception as e:
+                print(f"Warning: Could not calculate user house overlays for monthly chunk: {e}")
+            
+            # Calculate synastry aspects (mutual aspects between user and partner) - if available
+            try:
+                from aspects_engine import calculate_synastry_aspects
+                synastry_aspects_monthly = calculate_synastry_aspects(natal_chart, partner_chart, use_wider_orbs=False)
+                synastry_aspects_monthly_json = _to_prompt_json(synastry_aspects_monthly)
+                context += f"--- SYNASTRY ASPECTS (CALCULATED) ---\n"
+                context += f"CRITICAL: These are mutual aspects between {user_display_name} and {partner_display_name}.\n"
+                context += "Use them directly - DO NOT recalculate or assume aspects.\n"
+                context += "Format: planet1 (User) ↔ planet2 (Partner)\n"
+                context += f"{synastry_aspects_monthly_json}\n\n"
+            except Exception as e:
+                print(f"Warning: Could not calculate synastry aspects for monthly chunk: {e}")
+        else:
+            natal_json = _to_prompt_json(natal_chart)
+            context += f"--- NATAL CHART ---\n{natal_json}\n\n"
+            
+            # Calculate natal aspects for user
+            try:
+                natal_aspects_user_monthly = calculate_natal_aspects(natal_chart, use_wider_orbs=False)
+                natal_aspects_user_monthly_json = _to_prompt_json(natal_aspects_user_monthly)
+                context += f"--- NATAL ASPECTS (CALCULATED) ---\n"
+                context += "CRITICAL: These aspects are PRE-CALCULATED by the backend. Use them directly - DO NOT recalculate or assume aspects.\n"
+                context += f"{natal_aspects_user_monthly_json}\n\n"
+            except Exception as e:
+                print(f"Warning: Could not calculate natal aspects for monthly chunk: {e}")
+        
+        return context
+    
     async def _process_monthly_chunk(
         self,
         month: str,
@@ -1746,11 +2049,16 @@ class AIInterpreter:
         user_display_name: str,
         partner_display_name: str,
         question: str,
-        has_partner: bool
+        has_partner: bool,
+        static_context: Optional[str] = None
     ) -> str:
         """
         Process a single month's events and generate AI interpretation.
         
+        Args:
+            static_context: Optional result of _build_monthly_context(...), built once
+                and shared by all months of the same forecast
+        
         Returns:
             Monthly forecast text or error message
         """
@@ -1758,117 +2066,24 @@ class AIInterpreter:
         has_partner_flag = bool(has_partner and partner_chart is not None)
         
         try:
-            # Calculate house rulers for the natal chart
-            houses = natal_chart.get("houses", {})
-            house_rulers = self.engine.get_house_rulers(houses) if houses else {}
-            
-            # Calculate house rulers for partner chart if present
-            partner_house_rulers = None
-            if partner_chart:
-                partner_houses = partner_chart.get("houses", {})
-                partner_house_rulers = self.engine.get_house_rulers(partner_houses) if partner_houses else {}
-            
-            # Build system prompt
-            system_prompt = self._build_dynamic_system_prompt(
-                report_type=report_type,
-                language=language,
-                natal_chart=natal_chart,
-                partner_chart=partner_chart,
-                user_display_name=user_display_name,
-                partner_display_name=partner_display_name,
-                has_partner=has_partner_flag,
-                user_question=question,
-                house_rulers=house_rulers,
-                partner_house_rulers=partner_house_rulers
-            )
+            if static_context is None:
+                static_context = self._build_monthly_context(
+                    report_type=report_type,
+                    language=language,
+                    natal_chart=natal_chart,
+                    partner_chart=partner_chart,
+                    user_display_name=user_display_name,
+                    partner_display_name=partner_display_name,
+                    question=question,
+                    has_partner=has_partner
+                )
             
-            # Build user prompt with monthly events
-            monthly_events_json = json.dumps(monthly_events, indent=2, ensure_ascii=False)
+            # Build user prompt with monthly events (only the month-specific part)
+            monthly_events_json = _to_prompt_json(monthly_events)
             
             user_prompt = f"PERIOD: {month}\n"
             user_prompt += f"FOCUS: {report_type.upper()}\n\n"
             
-            if has_partner_flag:
-                natal_json = json.dumps(natal_chart, indent=2, ensure_ascii=False)
-                partner_json = json.dumps(partner_chart, indent=2, ensure_ascii=False)
-                user_prompt += f"--- {user_display_name.upper()} NATAL CHART ---\n{natal_json}\n\n"
-                
-                # Calculate natal aspects for user
-                try:
-                    natal_aspects_user_monthly = calculate_natal_aspects(natal_chart, use_wider_orbs=False)
-                    natal_aspects_user_monthly_json = json.dumps(natal_aspects_user_monthly, indent=2, ensure_ascii=False)
-                    user_prompt += f"--- {user_display_name.upper()} NATAL ASPECTS (CALCULATED) ---\n"
-                    user_prompt += "CRITICAL: These aspects are PRE-CALCULATED by the backend. Use them directly - DO NOT recalculate or assume aspects.\n"
-                    user_prompt += f"{natal_aspects_user_monthly_json}\n\n"
-                except Exception as e:
-                    print(f"Warning: Could not calculate user natal aspects for monthly chunk: {e}")
-                
-                user_prompt += f"--- {partner_display_name.upper()} NATAL CHART ---\n{partner_json}\n\n"
-                
-                # Calculate natal aspects for partner
-                try:
-                    partner_natal_aspects_monthly = calculate_natal_aspects(partner_chart, use_wider_orbs=False)
-                    partner_natal_aspects_monthly_json = json.dumps(partner_natal_aspects_monthly, indent=2, ensure_ascii=False)
-                    user_prompt += f"--- {partner_display_name.upper()} NATAL ASPECTS (CALCULATED) ---\n"
-                    user_prompt += "CRITICAL: These aspects are PRE-CALCULATED by the backend. Use them directly - DO NOT recalculate or assume aspects.\n"
-                    user_prompt += f"{partner_natal_aspects_monthly_json}\n\n"
-                except Exception as e:
-                    print(f"Warning: Could not calculate partner natal aspects for monthly chunk: {e}")
-                
-                # Calculate synastry house overlays (Partner's planets in User's houses)
-                try:
-                    partner_overlays = self.engine.calculate_synastry_house_overlays(
-                        user_natal_chart=natal_chart,
-                        partner_planets=partner_chart.get("planets", {})
-                    )
-                    partner_overlays_json = json.dumps(partner_overlays, indent=2, ensure_ascii=False)
-                    user_prompt += f"--- PARTNER PLANETS IN USER'S NATAL HOUSES (CALCULATED) ---\n"
-                    user_prompt += "CRITICAL: These house placements are PRE-CALCULATED by the backend using Placidus house system. Use them directly - DO NOT recalculate.\n"
-                    user_prompt += "Each number represents which of User's houses the Partner's planet falls into.\n"
-                    user_prompt += f"{partner_overlays_json}\n\n"
-                except Exception as e:
-                    print(f"Warning: Could not calculate partner house overlays for monthly chunk: {e}")
-                
-                # Calculate reverse overlays (User's planets in Partner's houses) - for completeness
-                try:
-                    user_overlays = self.engine.calculate_synastry_house_overlays(
-                        user_natal_chart=partner_chart,
-                        partner_planets=natal_chart.get("planets", {})
-                    )
-                    user_overlays_json = json.dumps(user_overlays, indent=2, ensure_ascii=False)
-                    user_prompt += f"--- {user_display_name.upper()} PLANETS IN {partner_display_name.upper()}'S NATAL HOUSES (CALCULATED) ---\n"
-                    user_prompt += "CRITICAL: These house placements are PRE-CALCULATED by the backend using Placidus house system. Use them directly - DO NOT recalculate.\n"
-                    user_prompt += "Each number represents which of Partner's houses the User's planet falls into.\n"
-                    user_prompt += f"{user_overlays_json}\n\n"
-                except Exception as e:
-                    print(f"Warning: Could not calculate user house overlays for monthly chunk: {e}")
-                
-                # Calculate synastry aspects (mutual aspects between user and partner) - if available
-                try:
-                    from aspects_engine import calculate_synastry_aspects
-                    synastry_aspects_monthly = calculate_synastry_aspects(natal_chart, partner_chart, use_wider_orbs=False)
-                    synastry_aspects_monthly_json = json.dumps(synastry_aspects_monthly, indent=2, ensure_ascii=False)
-                    user_prompt += f"--- SYNASTRY ASPECTS (CALCULATED) ---\n"
-                    user_prompt += f"CRITICAL: These are mutual aspects between {user_display_name} and {partner_display_name}.\n"
-                    user_prompt += "Use them directly - DO NOT recalculate or assume aspects.\n"
-                    user_prompt += "Format: planet1 (User) ↔ planet2 (Partner)\n"
-                    user_prompt += f"{synastry_aspects_monthly_json}\n\n"
-                except Exception as e:
-                    print(f"Warning: Could not calculate synastry aspects for monthly chunk: {e}")
-            else:
-                natal_json = json.dumps(natal_chart, indent=2, ensure_ascii=False)
-                user_prompt += f"--- NATAL CHART ---\n{natal_json}\n\n"
-                
-                # Calculate natal aspects for user
-                try:
-                    natal_aspects_user_monthly = calculate_natal_aspects(natal_chart, use_wider_orbs=False)
-                    natal_aspects_user_monthly_json = json.dumps(natal_aspects_user_monthly, indent=2, ensure_ascii=False)
-                    user_prompt += f"--- NATAL ASPECTS (CALCULATED) ---\n"
-                    user_prompt += "CRITICAL: These aspects are PRE-CALCULATED by the backend. Use them directly - DO NOT recalculate or assume aspects.\n"
-                    user_prompt += f"{natal_aspects_user_monthly_json}\n\n"
-                except Exception as e:
-                    print(f"Warning: Could not calculate natal aspects for monthly chunk: {e}")
-            
             user_prompt += f"--- TIMELINE EVENTS FOR {month} ---\n{monthly_events_json}\n\n"
             
             if question:
@@ -1888,7 +2103,7 @@ class AIInterpreter:
             data = {
                 "model": "Qwen/Qwen3-235B-A22B-Instruct-2507-tput",
                 "messages": [
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": static_context},
                     {"role": "user", "content": user_prompt}
                 ],
                 "temperature": 0.7,
@@ -1900,8 +2115,14 @@ class AIInterpreter:
                 if response.status_code != 200:
                     error_detail = response.text
                     raise RuntimeError(f"API returned status {response.status_code}: {error_detail}")
-                response.raise_for_status()
-                response_data = response.json()
+                response_data = orjson.loads(response.content)
+                # Колко от префикса е прочетен от кеша на доставчика (OpenAI-съвместим usage)
+                usage = response_data.get("usage") or {}
+                cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+                logger.info(
+                    "Monthly chunk %s: prompt_tokens=%s cached_tokens=%s",
+                    month, usage.get("prompt_tokens"), cached_tokens
+                )
                 content = response_data["choices"][0]["message"]["content"]
                 return content.strip() if content else ""
             
@@ -1910,6 +2131,35 @@ class AIInterpreter:
             # Avoid exposing internal variable names in error messages
             return f"*Грешка при генериране на прогноза за {month}: {error_msg}*"
     
+    async def _process_months_concurrently(
+        self,
+        months: List[str],
+        events_by_month: Dict[str, List[Dict]],
+        **chunk_kwargs
+    ) -> List[str]:
+        """
+        Обработва няколко месеца паралелно (до MONTHLY_CHUNK_CONCURRENCY заявки наведнъж).
+        
+        Args:
+            months: Месеците ("YYYY-MM") в реда, в който се искат резултатите
+            events_by_month: Събитията, групирани по месец
+            **chunk_kwargs: Останалите аргументи на _process_monthly_chunk (еднакви за всички месеци)
+            
+        Returns:
+            Текстовете на прогнозите в реда на months
+        """
+        semaphore = asyncio.Semaphore(MONTHLY_CHUNK_CONCURRENCY)
+        
+        async def process_month(month: str) -> str:
+            async with semaphore:
+                return await self._process_monthly_chunk(
+                    month=month,
+                    monthly_events=events_by_month[month],
+                    **chunk_kwargs
+                )
+        
+        return await asyncio.gather(*(process_month(month) for month in months))
+    
     async def interpret_chart(
         self,
         natal_chart: Dict,
@@ -1960,39 +2210,43 @@ class AIInterpreter:
             start_date_str = sorted_months[0]
             end_date_str = sorted_months[-1]
             
-            # Format month names for display (Bulgarian)
-            month_names = {
-                "01": "Януари", "02": "Февруари", "03": "Март", "04": "Април",
-                "05": "Май", "06": "Юни", "07": "Юли", "08": "Август",
-                "09": "Септември", "10": "Октомври", "11": "Ноември", "12": "Декември"
-            }
-            
-            full_report = f"# Прогноза за Връзка ({month_names.get(start_date_str[5:7], start_date_str[5:7])} {start_date_str[:4]} - {month_names.get(end_date_str[5:7], end_date_str[5:7])} {end_date_str[:4]})\n\n"
+            full_report = f"# Прогноза за Връзка ({format_month_bg(start_date_str)} - {format_month_bg(end_date_str)})\n\n"
             
             if question:
                 full_report += f"**Въпрос:** {question}\n\n"
             
             full_report += f"**Анализ за {user_display_name} и {partner_display_name}**\n\n---\n\n"
             
-            # Process each month
-            for idx, month in enumerate(sorted_months):
-                monthly_events = events_by_month[month]
-                
-                monthly_text = await self._process_monthly_chunk(
-                    month=month,
-                    monthly_events=monthly_events,
-                    report_type=report_type,
-                    language=language,
-                    natal_chart=natal_chart,
-                    partner_chart=partner_chart,
-                    user_display_name=user_display_name,
-                    partner_display_name=partner_display_name,
-                    question=question,  # Include question in ALL chunks so each month answers it
-                    has_partner=True
-                )
-                
+            # Static prefix shared by every month (cached by the provider after the first call)
+            static_context = self._build_monthly_context(
+                report_type=report_type,
+                language=language,
+                natal_chart=natal_chart,
+                partner_chart=partner_chart,
+                user_display_name=user_display_name,
+                partner_display_name=partner_display_name,
+                question=question,
+                has_partner=True
+            )
+            
+            # Process all months concurrently (results keep the month order)
+            monthly_texts = await self._process_months_concurrently(
+                sorted_months,
+                events_by_month,
+                report_type=report_type,
+                language=language,
+                natal_chart=natal_chart,
+                partner_chart=partner_chart,
+                user_display_name=user_display_name,
+                partner_display_name=partner_display_name,
+                question=question,  # Include question in ALL chunks so each month answers it
+                has_partner=True,
+                static_context=static_context
+            )
+            
+            for month, monthly_text in zip(sorted_months, monthly_texts):
                 # Format month for display
-                month_display = f"{month_names.get(month[5:7], month[5:7])} {month[:4]}"
+                month_display = format_month_bg(month)
                 full_report += f"\n\n## Прогноза за {month_display}\n\n{monthly_text}\n\n---\n"
             
             return full_report
@@ -2015,39 +2269,43 @@ class AIInterpreter:
             start_date_str = sorted_months[0]
             end_date_str = sorted_months[-1]
             
-            # Format month names for display (Bulgarian)
-            month_names = {
-                "01": "Януари", "02": "Февруари", "03": "Март", "04": "Април",
-                "05": "Май", "06": "Юни", "07": "Юли", "08": "Август",
-                "09": "Септември", "10": "Октомври", "11": "Ноември", "12": "Декември"
-            }
-            
-            full_report = f"# Астрологична Прогноза ({month_names.get(start_date_str[5:7], start_date_str[5:7])} {start_date_str[:4]} - {month_names.get(end_date_str[5:7], end_date_str[5:7])} {end_date_str[:4]})\n\n"
+            full_report = f"# Астрологична Прогноза ({format_month_bg(start_date_str)} - {format_month_bg(end_date_str)})\n\n"
             
             if question:
                 full_report += f"**Въпрос:** {question}\n\n"
             
             full_report += "---\n\n"
             
-            # Process each month
-            for idx, month in enumerate(sorted_months):
-                monthly_events = events_by_month[month]
-                
-                monthly_text = await self._process_monthly_chunk(
-                    month=month,
-                    monthly_events=monthly_events,
-                    report_type=report_type,
-                    language=language,
-                    natal_chart=natal_chart,
-                    partner_chart=None,
-                    user_display_name=user_display_name,
-                    partner_display_name=partner_display_name,
-                    question=question,  # Include question in ALL chunks so each month answers it
-                    has_partner=False
-                )
-                
+            # Static prefix shared by every month (cached by the provider after the first call)
+            static_context = self._build_monthly_context(
+                report_type=report_type,
+                language=language,
+                natal_chart=natal_chart,
+                partner_chart=None,
+                user_display_name=user_display_name,
+                partner_display_name=partner_display_name,
+                question=question,
+                has_partner=False
+            )
+            
+            # Process all months concurrently (results keep the month order)
+            monthly_texts = await self._process_months_concurrently(
+                sorted_months,
+                events_by_month,
+                report_type=report_type,
+                language=language,
+                natal_chart=natal_chart,
+                partner_chart=None,
+                user_display_name=user_display_name,
+                partner_display_name=partner_display_name,
+                question=question,  # Include question in ALL chunks so each month answers it
+                has_partner=False,
+                static_context=static_context
+            )
+            
+            for month, monthly_text in zip(sorted_months, monthly_texts):
                 # Format month for display
-                month_display = f"{month_names.get(month[5:7], month[5:7])} {month[:4]}"
+                month_display = format_month_bg(month)
                 full_report += f"\n\n## Прогноза за {month_display}\n\n{monthly_text}\n\n---\n"
             
             return full_report
@@ -2104,18 +2362,11 @@ class AIInterpreter:
             system_prompt += self._get_bulgarian_language_rules()
             
             # Форматиране на данните като JSON за user_prompt
-            natal_json = json.dumps(natal_chart, indent=2, ensure_ascii=False)
-            partner_json = json.dumps(partner_chart, indent=2, ensure_ascii=False)
+            natal_json = _to_prompt_json(natal_chart)
+            partner_json = _to_prompt_json(partner_chart)
             
             # За транзитната карта, извличаме само планетите (без домовете)
-            transit_planets_only = {
-                "planets": transit_chart.get("planets", {}),
-                "datetime_utc": transit_chart.get("datetime_utc", ""),
-                "julian_day": transit_chart.get("julian_day", 0),
-                "timezone": transit_chart.get("timezone", ""),
-                "datetime_local": transit_chart.get("datetime_local", "")
-            }
-            transit_json = json.dumps(transit_planets_only, indent=2, ensure_ascii=False)
+            transit_json = self._transit_chart_json(transit_chart)
             
             user_prompt = f"User Question: {question if question else 'Provide a relationship forecast for this specific date.'}\n\n"
             # Calculate transit house mappings for both user and partner
@@ -2124,7 +2375,7 @@ class AIInterpreter:
                 user_transit_house_map = self.engine.map_transit_planets_to_natal_houses(
                     natal_chart, transit_planets
                 )
-                user_transit_map_json = json.dumps(user_transit_house_map, indent=2, ensure_ascii=False)
+                user_transit_map_json = _to_prompt_json(user_transit_house_map)
                 user_prompt += f"--- TRANSIT PLANETS IN {user_display_name.upper()}'S NATAL HOUSES (CALCULATED) ---\n"
                 user_prompt += "CRITICAL: These house placements are PRE-CALCULATED. Use them directly - DO NOT recalculate.\n"
                 user_prompt += f"{user_transit_map_json}\n\n"
@@ -2135,7 +2386,7 @@ class AIInterpreter:
                 partner_transit_house_map = self.engine.map_transit_planets_to_natal_houses(
                     partner_chart, transit_planets
                 )
-                partner_transit_map_json = json.dumps(partner_transit_house_map, indent=2, ensure_ascii=False)
+                partner_transit_map_json = _to_prompt_json(partner_transit_house_map)
                 user_prompt += f"--- TRANSIT PLANETS IN {partner_display_name.upper()}'S NATAL HOUSES (CALCULATED) ---\n"
                 user_prompt += "CRITICAL: These house placements are PRE-CALCULATED. Use them directly - DO NOT recalculate.\n"
                 user_prompt += f"{partner_transit_map_json}\n\n"
@@ -2145,7 +2396,7 @@ class AIInterpreter:
             # Calculate natal aspects for user
             try:
                 natal_aspects_user_rtf = calculate_natal_aspects(natal_chart, use_wider_orbs=False)
-                natal_aspects_user_rtf_json = json.dumps(natal_aspects_user_rtf, indent=2, ensure_ascii=False)
+                natal_aspects_user_rtf_json = _to_prompt_json(natal_aspects_user_rtf)
             except Exception as e:
                 print(f"Warning: Could not calculate user natal aspects: {e}")
                 natal_aspects_user_rtf_json = None
@@ -2267,21 +2518,21 @@ class AIInterpreter:
             system_prompt += self._get_bulgarian_language_rules()
             
             # Форматиране на данните като JSON за user_prompt
-            natal_json = json.dumps(natal_chart, indent=2, ensure_ascii=False)
-            partner_json = json.dumps(partner_chart, indent=2, ensure_ascii=False)
+            natal_json = _to_prompt_json(natal_chart)
+            partner_json = _to_prompt_json(partner_chart)
             
             # Calculate natal aspects for user
             try:
                 natal_aspects_user = calculate_natal_aspects(natal_chart, use_wider_orbs=False)
-                natal_aspects_user_json = json.dumps(natal_aspects_user, indent=2, ensure_ascii=False)
+                natal_aspects_user_json = _to_prompt_json(natal_aspects_user)
             except Exception as e:
                 print(f"Warning: Could not calculate user natal aspects: {e}")
                 natal_aspects_user_json = None
             
             # Calculate partner natal aspects
             try:
-                partner_natal_aspects = calculate_natal_aspects(partner_chart, use_wider_orbs=False)
-                partner_natal_aspects_json = json.dumps(partner_natal_aspects, indent=2, ensure_ascii=False)
+                partner_natal_aspects = calculate_natal_aspects(partner_chart, use_wider_orbs=False, top_k=PARTNER_ASPECTS_TOP_K)
+                partner_natal_aspects_json = _to_prompt_json(partner_natal_aspects)
                 print(f"✅ Calculated {len(partner_natal_aspects)} partner natal aspects")
             except Exception as e:
                 print(f"⚠️ Warning: Could not calculate partner natal aspects: {e}")
@@ -2291,7 +2542,7 @@ class AIInterpreter:
             try:
                 from aspects_engine import calculate_synastry_aspects
                 synastry_aspects = calculate_synastry_aspects(natal_chart, partner_chart, use_wider_orbs=False)
-                synastry_aspects_json = json.dumps(synastry_aspects, indent=2, ensure_ascii=False)
+                synastry_aspects_json = _to_prompt_json(synastry_aspects)
                 print(f"✅ Calculated {len(synastry_aspects)} synastry aspects")
             except Exception as e:
                 print(f"⚠️ Warning: Could not calculate synastry aspects: {e}")
@@ -2303,7 +2554,7 @@ class AIInterpreter:
                     user_natal_chart=partner_chart,
                     partner_planets=natal_chart.get("planets", {})
                 )
-                reverse_overlays_json = json.dumps(reverse_overlays, indent=2, ensure_ascii=False)
+                reverse_overlays_json = _to_prompt_json(reverse_overlays)
                 print(f"✅ Calculated reverse overlays: {user_display_name} planets in {partner_display_name} houses")
             except Exception as e:
                 print(f"⚠️ Warning: Could not calculate reverse overlays: {e}")
@@ -2490,12 +2741,12 @@ class AIInterpreter:
             system_prompt += self._get_bulgarian_language_rules()
             
             # Форматиране на данните като JSON за user_prompt
-            natal_json = json.dumps(natal_chart, indent=2, ensure_ascii=False)
+            natal_json = _to_prompt_json(natal_chart)
             
             # Calculate natal aspects
             try:
                 natal_aspects = calculate_natal_aspects(natal_chart, use_wider_orbs=False)
-                natal_aspects_json = json.dumps(natal_aspects, indent=2, ensure_ascii=False)
+                natal_aspects_json = _to_prompt_json(natal_aspects)
             except Exception as e:
                 print(f"Warning: Could not calculate natal aspects: {e}")
                 natal_aspects_json = None
@@ -2518,7 +2769,7 @@ class AIInterpreter:
                     synastry_overlays = self.engine.calculate_synastry_house_overlays(
                         natal_chart, partner_planets
                     )
-                    synastry_overlays_json = json.dumps(synastry_overlays, indent=2, ensure_ascii=False)
+                    synastry_overlays_json = _to_prompt_json(synastry_overlays)
                     user_prompt += f"--- PARTNER PLANETS IN USER'S NATAL HOUSES (CALCULATED) ---\n"
                     user_prompt += "⚠️⚠️⚠️ MANDATORY - READ THIS SECTION FIRST BEFORE WRITING ANYTHING ABOUT HOUSE PLACEMENTS ⚠️⚠️⚠️\n"
                     user_prompt += "This JSON contains the ONLY VALID house placements for Partner's planets in User's houses.\n"
@@ -2541,8 +2792,8 @@ class AIInterpreter:
                 
                 # Calculate partner natal aspects for prompt
                 try:
-                    partner_natal_aspects = calculate_natal_aspects(partner_chart, use_wider_orbs=False)
-                    partner_natal_aspects_json = json.dumps(partner_natal_aspects, indent=2, ensure_ascii=False)
+                    partner_natal_aspects = calculate_natal_aspects(partner_chart, use_wider_orbs=False, top_k=PARTNER_ASPECTS_TOP_K)
+                    partner_natal_aspects_json = _to_prompt_json(partner_natal_aspects)
                     user_prompt += f"--- {partner_display_name.upper()} NATAL ASPECTS (CALCULATED) ---\n"
                     user_prompt += "CRITICAL: These aspects are PRE-CALCULATED by the backend. Use them directly - DO NOT recalculate or assume aspects.\n"
                     user_prompt += f"{partner_natal_aspects_json}\n\n"
@@ -2550,7 +2801,7 @@ class AIInterpreter:
                 except Exception as e:
                     print(f"⚠️ Warning: Could not calculate partner natal aspects: {e}")
                 
-                partner_json = json.dumps(partner_chart, indent=2, ensure_ascii=False)
+                partner_json = _to_prompt_json(partner_chart)
                 user_prompt += f"--- {partner_display_name.upper()} NATAL CHART ---\n"
                 user_prompt += "CRITICAL: Use the 'formatted_pos' field for each planet's position. Do NOT calculate from 'longitude'.\n"
                 user_prompt += f"{partner_json}\n\n"
@@ -2563,7 +2814,7 @@ class AIInterpreter:
                     transit_house_map = self.engine.map_transit_planets_to_natal_houses(
                         natal_chart, transit_planets
                     )
-                    transit_house_map_json = json.dumps(transit_house_map, indent=2, ensure_ascii=False)
+                    transit_house_map_json = _to_prompt_json(transit_house_map)
                     user_prompt += f"--- TRANSIT PLANETS IN USER'S NATAL HOUSES (CALCULATED) ---\n"
                     user_prompt += "CRITICAL: These house placements are PRE-CALCULATED by the backend. Use them directly - DO NOT recalculate.\n"
                     user_prompt += f"{transit_house_map_json}\n\n"
@@ -2571,14 +2822,7 @@ class AIInterpreter:
                     print(f"Warning: Could not calculate transit house mappings: {e}")
                 
                 # За транзитната карта, извличаме само планетите (без домовете)
-                transit_planets_only = {
-                    "planets": transit_planets,
-                    "datetime_utc": transit_chart.get("datetime_utc", ""),
-                    "julian_day": transit_chart.get("julian_day", 0),
-                    "timezone": transit_chart.get("timezone", ""),
-                    "datetime_local": transit_chart.get("datetime_local", "")
-                }
-                transit_json = json.dumps(transit_planets_only, indent=2, ensure_ascii=False)
+                transit_json = self._transit_chart_json(transit_chart)
                 
                 user_prompt += f"--- TRANSIT PLANETARY POSITIONS (Date: {target_date}) ---\n"
                 user_prompt += "CRITICAL: Use the 'formatted_pos' field for each planet's position. Do NOT calculate from 'longitude'.\n"
@@ -2586,117 +2830,22 @@ class AIInterpreter:
             
             # Add specific instructions for money and love reports
             if report_type == "money":
-                user_prompt += (
-                    "\n*** CRITICAL INSTRUCTIONS FOR MONEY ANALYSIS ***\n"
-                    "1. **HOUSE RULERS ARE ALREADY CALCULATED** - Do NOT recalculate them from house cusp longitudes.\n"
-                    "2. **USE HOUSE RULERS FROM CONTEXT** - The system prompt provides the rulers (e.g., 'Money Ruler (2nd House): Sun').\n"
-                    "3. **TO FIND HOUSE CUSP SIGNS**: Look in the 'houses' object - use the 'formatted_pos' or convert the cusp longitude to sign using _decimal_to_dms logic (but prefer using provided house ruler info).\n"
-                    "4. **TO FIND WHERE THE RULER IS**: Look in the 'planets' object for the ruler planet (e.g., if ruler is 'Sun', find 'Sun' in planets and see its 'house' field).\n"
-                    "5. **EXAMPLE CORRECT LOGIC**:\n"
-                    "   - System says: 'Money Ruler (2nd House): Sun'\n"
-                    "   - In planets JSON, find 'Sun' → see it has 'house': 10 and 'zodiac_sign': 'Aries'\n"
-                    "   - Therefore: '2nd House is ruled by Sun. Sun is in Aries in 10th House → Money comes through career/public role'\n"
-                    "6. **DO NOT**: Say '2nd House is in Aries' or calculate house cusp signs incorrectly from longitude.\n"
-                    "7. **ALWAYS USE MODERN RULERS**: Uranus for Aquarius, Neptune for Pisces, Pluto for Scorpio.\n"
-                    "8. **FOCUS ON**: Position of the ruler (which house and sign it's in) - this shows HOW money is generated.\n\n"
-                )
+                user_prompt += STATIC_MODE_INSTRUCTIONS["money"]
             elif report_type == "love" and partner_chart:
-                user_prompt += (
-                    "\n*** ⚠️ CRITICAL INSTRUCTIONS FOR LOVE ANALYSIS (SYNASTRY MODE) - MANDATORY ***\n"
-                    "1. **PARTNER HOUSE OVERLAYS ARE PRE-CALCULATED** - Look at 'PARTNER PLANETS IN USER'S NATAL HOUSES (CALCULATED)' section above.\n"
-                    "2. **USE EXACT NUMBERS FROM OVERLAY DATA** - If it shows {'Sun': 8}, say 'User's 8th house' (NOT 9th, NOT 2nd, NOT any other number).\n"
-                    "3. **ALWAYS SAY 'User's [X]th house'** - Never say just '[X]th house' without 'User's' prefix to avoid confusion.\n"
-                    "4. **FORBIDDEN EXAMPLES** - Never say:\n"
-                    "   - 'Partner's Sun in 9th house' if overlay shows 8\n"
-                    "   - 'Partner's Mars in 4th house' if overlay shows 12\n"
-                    "   - 'Partner's Sun in 2nd house' (referring to Partner's own chart)\n"
-                    "5. **CORRECT EXAMPLES** - Always say:\n"
-                    "   - 'Partner's Sun is in User's 8th house' (if overlay shows 'Sun': 8)\n"
-                    "   - 'Partner's Moon is in User's 1st house' (if overlay shows 'Moon': 1)\n"
-                    "   - 'Partner's Venus is in User's 8th house' (if overlay shows 'Venus': 8)\n"
-                    "   - 'Partner's Mars is in User's 12th house' (if overlay shows 'Mars': 12)\n"
-                    "6. **HOUSE RULERS ARE ALREADY CALCULATED** - Use them from context (e.g., 'Love Ruler (7th House): Venus').\n"
-                    "7. **DO NOT mention aspects** between planets unless they are explicitly provided in the chart data.\n\n"
-                )
+                user_prompt += STATIC_MODE_INSTRUCTIONS["love_synastry"]
             
             # Условни инструкции базирани на режима
+            names = {"user_display_name": user_display_name, "partner_display_name": partner_display_name}
             if transit_chart is None:
                 if partner_chart:
-                    user_prompt += (
-                        f"Please provide a comprehensive SYNASTRY analysis covering:\n\n"
-                        f"1. NO ASPECT CALCULATIONS:\n"
-                        f"   - The backend does NOT provide aspect data between charts.\n"
-                        f"   - **DO NOT mention any aspects** (conjunction, square, trine, etc.) between {user_display_name} and {partner_display_name}.\n"
-                        f"   - Focus ONLY on house overlays and natal chart interpretations.\n\n"
-                        f"2. HOUSE OVERLAYS:\n"
-                        f"   - The house placements are ALREADY CALCULATED in 'PARTNER PLANETS IN USER'S NATAL HOUSES (CALCULATED)'.\n"
-                        f"   - USE THESE PRE-CALCULATED HOUSE NUMBERS - DO NOT recalculate them.\n"
-                        f"   - How does {partner_display_name} impact {user_display_name}'s life goals (10th house) and emotional security (4th house)?\n"
-                        f"   - Analyze 1st house (identity), 5th house (romance), 7th house (partnership), 8th house (intimacy), 12th house (subconscious).\n\n"
-                        f"3. RELATIONSHIP AREAS:\n"
-                        f"   - Emotional connection (her Moon in your house, 4th house overlays)\n"
-                        f"   - Communication (her Mercury in your house, 3rd house overlays)\n"
-                        f"   - Sexual chemistry (her Venus/Mars in your 5th/8th/12th house overlays)\n"
-                        f"   - Long-term potential (Saturn in your houses, 7th/10th house overlays)\n\n"
-                        f"4. Use ONLY the 'formatted_pos' values provided. Do NOT calculate from raw longitude.\n"
-                        f"5. Do NOT predict the future or mention transits."
-                    )
+                    user_prompt += STATIC_MODE_INSTRUCTIONS["synastry"].format(**names)
                 else:
-                    user_prompt += (
-                        "Please provide a comprehensive NATAL CHART analysis:\n"
-                        "1. **PERSONALITY TRAITS:** Analyze personality traits based on planetary positions and signs.\n"
-                        "2. **ASCENDANT (MANDATORY SECTION):** Analyze the Ascendant sign and degree in detail. Explain:\n"
-                        "   - The outer mask and first impression the person creates\n"
-                        "   - Physical appearance tendencies\n"
-                        "   - How the Ascendant contrasts or harmonizes with the Sun sign\n"
-                        "   - The person's initial reaction to the world and how they 'start' in life\n"
-                        "   - Example: 'Ascendant in Cancer 14°22' - The Protective Shell: Despite the fiery Sun in Aries, your outer presentation is soft, caring, and intuitive. People see you as someone they can trust and rely on.'\n"
-                        "3. Identify life themes and karmic patterns.\n"
-                        "4. Explain strengths and challenges from aspects.\n"
-                        "5. Describe house placements and their meanings.\n"
-                        "6. Focus on psychological patterns and inner motivations.\n"
-                        "7. Do NOT predict the future or mention transits.\n"
-                        "8. Focus on the person's inherent nature and potential."
-                    )
+                    user_prompt += STATIC_MODE_INSTRUCTIONS["natal"]
             else:
                 if partner_chart:
-                    user_prompt += (
-                        f"Please provide a comprehensive SYNASTRY + FORECAST analysis:\n\n"
-                        f"1. SYNASTRY (Compatibility):\n"
-                        f"   - Compare {user_display_name}'s planets with {partner_display_name}'s planets.\n"
-                        f"   - Focus on Personal Planets (Sun, Moon, Mercury, Venus, Mars).\n"
-                        f"   - Identify Sun/Moon conjunctions (soulmate potential).\n"
-                        f"   - Identify Mars/Venus aspects (sexual chemistry).\n"
-                        f"   - House overlays: Use the PRE-CALCULATED house placements from 'PARTNER PLANETS IN USER'S NATAL HOUSES (CALCULATED)'.\n"
-                        f"   - DO NOT recalculate house positions - use the provided numbers.\n"
-                        f"   - How does {partner_display_name} impact {user_display_name}'s life goals (10th house) and emotional security (4th house)?\n\n"
-                        f"2. RELATIONSHIP FORECAST (with Transits):\n"
-                        f"   - Analyze transits to BOTH charts ({user_display_name} and {partner_display_name}).\n"
-                        f"   - Will they stay together? Is there a crisis or opportunity?\n"
-                        f"   - Use the PRE-CALCULATED transit house mappings from 'TRANSIT PLANETS IN USER'S NATAL HOUSES (CALCULATED)'.\n"
-                        f"   - Look for transiting planets activating relationship houses (7th house) or Venus/Mars.\n"
-                        f"   - Identify periods of harmony or tension.\n\n"
-                        f"3. RELATIONSHIP AREAS:\n"
-                        f"   - Emotional connection (Moon aspects, 4th house overlays)\n"
-                        f"   - Communication (Mercury aspects, 3rd house overlays)\n"
-                        f"   - Sexual chemistry (Mars/Venus aspects, 5th/8th house overlays)\n"
-                        f"   - Long-term potential (Saturn aspects, 7th/10th house overlays)\n\n"
-                        f"4. Use ONLY the 'formatted_pos' values provided. Do NOT calculate from raw longitude.\n"
-                        f"5. Be specific about dates, degrees, and aspects.\n"
-                        f"6. Focus on practical implications for the relationship."
-                    )
+                    user_prompt += STATIC_MODE_INSTRUCTIONS["synastry_forecast"].format(**names)
                 else:
-                    user_prompt += (
-                        "Please provide a comprehensive FORECAST analysis:\n"
-                        "1. Compare each transit planet's position to the natal chart.\n"
-                        "2. Identify significant aspects between transit and natal planets.\n"
-                        "3. Use the PRE-CALCULATED transit house mappings from 'TRANSIT PLANETS IN USER'S NATAL HOUSES (CALCULATED)'.\n"
-                        "   DO NOT recalculate house positions - use the provided numbers.\n"
-                        "4. Analyze potential for meeting a new partner (5th/7th house transits) if relevant.\n"
-                        "5. Explain what these transits mean for the person at this specific date.\n"
-                        "6. Be specific about dates, degrees, and aspects.\n"
-                        "7. Focus on practical implications and timing."
-                    )
+                    user_prompt += STATIC_MODE_INSTRUCTIONS["forecast"]
         
         # Добавяне на инструкция за езика
         if language == "bg":
@@ -2746,8 +2895,7 @@ class AIInterpreter:
                 if response.status_code != 200:
                     error_detail = response.text
                     raise RuntimeError(f"API returned status {response.status_code}: {error_detail}")
-                response.raise_for_status()
-                response_data = response.json()
+                response_data = orjson.loads(response.content)
                 content = response_data["choices"][0]["message"]["content"]
                 interpretation = content.strip() if content else ""
                 return interpretation
@@ -2758,19 +2906,25 @@ class AIInterpreter:
 
 # Глобална инстанция за удобство (опционално)
 _interpreter_instance: Optional[AIInterpreter] = None
+_interpreter_lock = threading.Lock()
 
 
 def get_interpreter() -> AIInterpreter:
     """
     Връща глобална инстанция на AIInterpreter (singleton pattern).
     
+    Използва double-checked locking, за да не се създадат две инстанции
+    при едновременни извиквания от различни нишки.
+    
     Returns:
         AIInterpreter инстанция
     """
     global _interpreter_instance
     
     if _interpreter_instance is None:
-        _interpreter_instance = AIInterpreter()
+        with _interpreter_lock:
+            if _interpreter_instance is None:
+                _interpreter_instance = AIInterpreter()
     
     return _interpreter_instance
 
@@ -3,9 +3,21 @@
 Използва се за натални аспекти, синастрични аспекти и транзитни аспекти
 """
 
+import heapq
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
 
+# Основни аспекти и техните точни ъгли (в градуси)
+ASPECT_ANGLES = (
+    ("conjunction", 0),
+    ("opposition", 180),
+    ("square", 90),
+    ("trine", 120),
+    ("sextile", 60),
+)
+
+
 def _get_orb_for_aspect(
     planet1: str,
     planet2: str,
@@ -46,9 +58,21 @@ def _calculate_angle(longitude1: float, longitude2: float) -> float:
     return min(diff, 360 - diff)
 
 
+def _sort_by_orb(aspects: List[Dict], top_k: Optional[int] = None) -> List[Dict]:
+    """
+    Сортира аспектите по орб (най-точните първи).
+    Ако е зададен top_k, използва heapq.nsmallest вместо пълно сортиране.
+    """
+    if top_k is not None:
+        return heapq.nsmallest(top_k, aspects, key=lambda x: x["orb"])
+    aspects.sort(key=lambda x: x["orb"])
+    return aspects
+
+
 def calculate_natal_aspects(
     chart_data: Dict,
-    use_wider_orbs: bool = False
+    use_wider_orbs: bool = False,
+    top_k: Optional[int] = None
 ) -> List[Dict]:
     """
     Изчислява аспекти в една натална карта.
@@ -56,6 +80,7 @@ def calculate_natal_aspects(
     Args:
         chart_data: Речник с данни от наталната карта (съдържа "planets" и "angles")
         use_wider_orbs: Дали да се използват по-широки орбове
+        top_k: Ако е зададено, връща само top_k аспекта с най-малък орб
     
     Returns:
         Списък с речници, всеки съдържа:
@@ -68,9 +93,10 @@ def calculate_natal_aspects(
     points = {}
 
     # Добавяне на планети
-    for name, data in chart_data.get("planets", {}).items():
-        if data.get("longitude") is not None:
-            points[name] = data["longitude"]
+    for name, data in (chart_data.get("planets") or {}).items():
+        lon = data.get("longitude")
+        if lon is not None:
+            points[name] = lon
 
     # Добавяне на ъгли
     angles = chart_data.get("angles", {})
@@ -79,13 +105,16 @@ def calculate_natal_aspects(
     if angles.get("MC") is not None:
         points["MC"] = angles["MC"]
 
-    return _calculate_aspects_between_points(points, use_wider_orbs)
+    # Копия на кешираните речници - извикващият може да променя резултата
+    cached = _cached_aspects_between_points(tuple(points.items()), use_wider_orbs, top_k)
+    return [dict(aspect) for aspect in cached]
 
 
 def calculate_synastry_aspects(
     user_chart: Dict,
     partner_chart: Dict,
-    use_wider_orbs: bool = False
+    use_wider_orbs: bool = False,
+    top_k: Optional[int] = None
 ) -> List[Dict]:
     """
     Изчислява аспекти между две карти (Синастрия).
@@ -95,6 +124,7 @@ def calculate_synastry_aspects(
         user_chart: Натална карта на потребителя
         partner_chart: Натална карта на партньора
         use_wider_orbs: Дали да се използват по-широки орбове
+        top_k: Ако е зададено, връща само top_k аспекта с най-малък орб
     
     Returns:
         Списък с речници, всеки съдържа:
@@ -107,13 +137,15 @@ def calculate_synastry_aspects(
     user_points = {}
     partner_points = {}
 
-    for name, data in user_chart.get("planets", {}).items():
-        if data.get("longitude") is not None:
-            user_points[name] = data["longitude"]
+    for name, data in (user_chart.get("planets") or {}).items():
+        lon = data.get("longitude")
+        if lon is not None:
+            user_points[name] = lon
     
-    for name, data in partner_chart.get("planets", {}).items():
-        if data.get("longitude") is not None:
-            partner_points[name] = data["longitude"]
+    for name, data in (partner_chart.get("planets") or {}).items():
+        lon = data.get("longitude")
+        if lon is not None:
+            partner_points[name] = lon
 
     # Добавяне на ASC/MC само от user (за релационна динамика)
     angles = user_chart.get("angles", {})
@@ -126,7 +158,7 @@ def calculate_synastry_aspects(
     for p1_name, p1_lon in user_points.items():
         for p2_name, p2_lon in partner_points.items():
             angle = _calculate_angle(p1_lon, p2_lon)
-            for aspect_name, ideal in [("conjunction", 0), ("opposition", 180), ("square", 90), ("trine", 120), ("sextile", 60)]:
+            for aspect_name, ideal in ASPECT_ANGLES:
                 orb = abs(angle - ideal)
                 if orb <= 180:  # винаги вярно, но за сигурност
                     max_orb = _get_orb_for_aspect(p1_name, p2_name, aspect_name, use_wider_orbs)
@@ -138,14 +170,14 @@ def calculate_synastry_aspects(
                             "angle": round(angle, 2),
                             "orb": round(orb, 2)
                         })
-    aspects.sort(key=lambda x: x["orb"])
-    return aspects
+    return _sort_by_orb(aspects, top_k)
 
 
 def calculate_transit_aspects_to_natal(
     natal_chart: Dict,
     transit_chart: Dict,
-    use_wider_orbs: bool = False
+    use_wider_orbs: bool = False,
+    top_k: Optional[int] = None
 ) -> List[Dict]:
     """
     Изчислява аспекти между транзитни планети и натална карта.
@@ -155,6 +187,7 @@ def calculate_transit_aspects_to_natal(
         natal_chart: Натална карта
         transit_chart: Транзитна карта
         use_wider_orbs: Дали да се използват по-широки орбове
+        top_k: Ако е зададено, връща само top_k аспекта с най-малък орб
     
     Returns:
         Списък с речници, всеки съдържа:
@@ -167,19 +200,21 @@ def calculate_transit_aspects_to_natal(
     natal_points = {}
     transit_points = {}
 
-    for name, data in natal_chart.get("planets", {}).items():
-        if data.get("longitude") is not None:
-            natal_points[name] = data["longitude"]
+    for name, data in (natal_chart.get("planets") or {}).items():
+        lon = data.get("longitude")
+        if lon is not None:
+            natal_points[name] = lon
     
-    for name, data in transit_chart.get("planets", {}).items():
-        if data.get("longitude") is not None:
-            transit_points[name] = data["longitude"]
+    for name, data in (transit_chart.get("planets") or {}).items():
+        lon = data.get("longitude")
+        if lon is not None:
+            transit_points[name] = lon
 
     aspects = []
     for t_name, t_lon in transit_points.items():
         for n_name, n_lon in natal_points.items():
             angle = _calculate_angle(t_lon, n_lon)
-            for aspect_name, ideal in [("conjunction", 0), ("opposition", 180), ("square", 90), ("trine", 120), ("sextile", 60)]:
+            for aspect_name, ideal in ASPECT_ANGLES:
                 orb = abs(angle - ideal)
                 max_orb = _get_orb_for_aspect(t_name, n_name, aspect_name, use_wider_orbs)
                 if orb <= max_orb:
@@ -190,13 +225,26 @@ def calculate_transit_aspects_to_natal(
                         "angle": round(angle, 2),
                         "orb": round(orb, 2)
                     })
-    aspects.sort(key=lambda x: x["orb"])
-    return aspects
+    return _sort_by_orb(aspects, top_k)
+
+
+@lru_cache(maxsize=1024)
+def _cached_aspects_between_points(
+    points: Tuple[Tuple[str, float], ...],
+    use_wider_orbs: bool = False,
+    top_k: Optional[int] = None
+) -> Tuple[Dict, ...]:
+    """
+    Кешира аспектите по точките на картата (име, дължина).
+    Една и съща натална карта се пита многократно - в рамките на заявка и между заявки.
+    """
+    return tuple(_calculate_aspects_between_points(dict(points), use_wider_orbs, top_k))
 
 
 def _calculate_aspects_between_points(
     points: Dict[str, float],
-    use_wider_orbs: bool = False
+    use_wider_orbs: bool = False,
+    top_k: Optional[int] = None
 ) -> List[Dict]:
     """Помощна функция за изчисление между точки в една карта."""
     point_names = list(points.keys())
@@ -210,7 +258,7 @@ def _calculate_aspects_between_points(
             lon2 = points[p2]
             angle = _calculate_angle(lon1, lon2)
 
-            for aspect_name, ideal in [("conjunction", 0), ("opposition", 180), ("square", 90), ("trine", 120), ("sextile", 60)]:
+            for aspect_name, ideal in ASPECT_ANGLES:
                 orb = abs(angle - ideal)
                 max_orb = _get_orb_for_aspect(p1, p2, aspect_name, use_wider_orbs)
                 if orb <= max_orb:
@@ -221,5 +269,4 @@ def _calculate_aspects_between_points(
                         "angle": round(angle, 2),
                         "orb": round(orb, 2)
                     })
-    aspects.sort(key=lambda x: x["orb"])
-    return aspects
+    return _sort_by_orb(aspects, top_k)
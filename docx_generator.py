@@ -6,37 +6,203 @@ Generates professional DOCX documents for periods > 6 months
 """
 
 from docx import Document
-from docx.shared import Pt, RGBColor, Inches
+from docx.shared import Pt, RGBColor, Inches, Emu
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
-from io import BytesIO
+from copy import deepcopy
+from io import BufferedWriter, BytesIO, RawIOBase
 from datetime import datetime
+from functools import lru_cache
+from typing import AsyncIterator, BinaryIO, Optional
+import asyncio
+import contextlib
 import re
 
 
+SIGN_NAMES = {
+    'Aries': 'Овен', 'Taurus': 'Телец', 'Gemini': 'Близнаци',
+    'Cancer': 'Рак', 'Leo': 'Лъв', 'Virgo': 'Дева',
+    'Libra': 'Везни', 'Scorpio': 'Скорпион', 'Sagittarius': 'Стрелец',
+    'Capricorn': 'Козирог', 'Aquarius': 'Водолей', 'Pisces': 'Риби'
+}
+
+# Precompiled patterns (bold markers and English sign names)
+_BOLD_RE = re.compile(r'(\*\*.*?\*\*)')
+_SIGN_RE = re.compile('|'.join(SIGN_NAMES), re.IGNORECASE)
+_SIGN_NAMES_LOWER = {eng.lower(): bg for eng, bg in SIGN_NAMES.items()}
+# Markdown block prefixes recognised by _add_formatted_text
+_LINE_PREFIX_RE = re.compile(r'## |### |---|- ')
+# Characters python-docx writes as separate run elements instead of w:t text
+_RUN_SPECIAL_RE = re.compile(r'([\t\r])')
+
+
+# Paragraph style used by every chart summary table cell
+TABLE_CELL_STYLE = 'AstroCell'
+
+# Month / markdown heading styles: name -> (base heading, size pt, color, space before pt, space after pt)
+_HEADING_STYLES = {
+    'AstroMonth': ('Heading 1', 14, RGBColor(139, 92, 246), 6, 4),
+    'AstroH2': ('Heading 2', 11, RGBColor(139, 92, 246), 4, 2),
+    'AstroH3': ('Heading 3', 10, RGBColor(167, 139, 250), 3, 2),
+}
+
+# Write buffer for unbuffered sinks passed to generate_docx (docx parts are tens of KB each)
+DOCX_WRITE_BUFFER_SIZE = 64 * 1024
+
+# Max DOCX_WRITE_BUFFER_SIZE chunks held between the generator thread and a slow client
+DOCX_STREAM_QUEUE_SIZE = 4
+
+# Cover page separator line
+_SEPARATOR = '_' * 60
+
+# Bulgarian ordinal suffixes for houses 1-12
+_HOUSE_SUFFIXES = ('ви', 'ри', 'ти', 'ти', 'ти', 'ти', 'ти', 'ти', 'ти', 'ти', 'и', 'ти')
+
+
+def _as_text(value) -> str:
+    """Return value as str without re-wrapping strings; None becomes ''"""
+    if isinstance(value, str):
+        return value
+    return '' if value is None else str(value)
+
+
+@lru_cache(maxsize=1)
+def _report_skeleton() -> Document:
+    """
+    Build the empty report document (default font, spacing and shared styles) once.
+    
+    Never modified after construction; generate_docx works on deep copies.
+    """
+    doc = Document()
+    
+    # Set default font and spacing (for content pages)
+    style = doc.styles['Normal']
+    font = style.font
+    font.name = 'Arial'
+    font.size = Pt(9)  # Reduced from 13 to 9
+    
+    # Set paragraph spacing - reduced
+    paragraph_format = style.paragraph_format
+    paragraph_format.space_after = Pt(4)  # Reduced from 12
+    paragraph_format.line_spacing = 1.3  # Reduced from 1.8
+    
+    # Shared style for chart summary table cells (referenced by every cell)
+    cell_style = doc.styles.add_style(TABLE_CELL_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    cell_style.base_style = style
+    cell_style.font.size = Pt(9)
+    cell_style.paragraph_format.space_before = Pt(0)
+    cell_style.paragraph_format.space_after = Pt(0)
+    
+    # Month titles and markdown headings (based on the built-in headings to keep outline levels)
+    for name, (base, size, color, before, after) in _HEADING_STYLES.items():
+        heading_style = doc.styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+        heading_style.base_style = doc.styles[base]
+        heading_style.font.size = Pt(size)
+        heading_style.font.color.rgb = color
+        heading_style.paragraph_format.space_before = Pt(before)
+        heading_style.paragraph_format.space_after = Pt(after)
+    
+    return doc
+
+
+def _paragraph_xml(style_id: Optional[str] = None):
+    """Create a bare w:p element, optionally referencing a paragraph style"""
+    p = OxmlElement('w:p')
+    if style_id:
+        p_pr = OxmlElement('w:pPr')
+        p_style = OxmlElement('w:pStyle')
+        p_style.set(qn('w:val'), style_id)
+        p_pr.append(p_style)
+        p.append(p_pr)
+    return p
+
+
+def _append_run_xml(p, text: str, bold: bool = False):
+    """Append a w:r with text to a w:p element (tabs and carriage returns as w:tab / w:br)"""
+    r = OxmlElement('w:r')
+    if bold:
+        r_pr = OxmlElement('w:rPr')
+        r_pr.append(OxmlElement('w:b'))
+        r.append(r_pr)
+    for piece in _RUN_SPECIAL_RE.split(text):
+        if piece == '\t':
+            r.append(OxmlElement('w:tab'))
+        elif piece == '\r':
+            r.append(OxmlElement('w:br'))
+        elif piece:
+            t = OxmlElement('w:t')
+            t.text = piece
+            if piece != piece.strip():
+                t.set(qn('xml:space'), 'preserve')
+            r.append(t)
+    p.append(r)
+
+
+class _QueueSink(RawIOBase):
+    """
+    Unbuffered sink that hands written chunks from a worker thread to an asyncio.Queue.
+    
+    Blocks the writer while the queue is full, so a slow client throttles generation
+    instead of letting the whole file pile up in memory.
+    
+    Once aborted, the next write raises BrokenPipeError to stop generation; the cleanup
+    writes after it (buffer flush, ZIP end record) are dropped.
+    """
+    
+    def __init__(self, loop, queue):
+        super().__init__()
+        self._loop = loop
+        self._queue = queue
+        self.aborted = False
+        self._stopped = False
+    
+    def writable(self):
+        return True
+    
+    def write(self, b):
+        if self.aborted:
+            if self._stopped:
+                return len(b)
+            self._stopped = True
+            raise BrokenPipeError('DOCX stream consumer went away')
+        asyncio.run_coroutine_threadsafe(self._queue.put(bytes(b)), self._loop).result()
+        return len(b)
+
+
+class _IdentityDict(dict):
+    """Translation table that returns the key itself for missing entries"""
+    
+    def __missing__(self, key):
+        return key
+
+
+@lru_cache(maxsize=1024)
+def _translate_sign_text(formatted_pos: str) -> str:
+    """Translate English sign names to Bulgarian (memoized, positions repeat across reports)"""
+    return _SIGN_RE.sub(lambda m: _SIGN_NAMES_LOWER[m.group(0).lower()], formatted_pos)
+
+
 class DOCXGenerator:
-    def __init__(self):
-        self.planet_names = {
-            'Sun': 'Слънце', 'Moon': 'Луна', 'Mercury': 'Меркурий',
-            'Venus': 'Венера', 'Mars': 'Марс', 'Jupiter': 'Юпитер',
-            'Saturn': 'Сатурн', 'Uranus': 'Уран', 'Neptune': 'Нептун',
-            'Pluto': 'Плутон', 'Node': 'Възходящ Възел', 'Chiron': 'Хирон'
-        }
-        
-        self.sign_names = {
-            'Aries': 'Овен', 'Taurus': 'Телец', 'Gemini': 'Близнаци',
-            'Cancer': 'Рак', 'Leo': 'Лъв', 'Virgo': 'Дева',
-            'Libra': 'Везни', 'Scorpio': 'Скорпион', 'Sagittarius': 'Стрелец',
-            'Capricorn': 'Козирог', 'Aquarius': 'Водолей', 'Pisces': 'Риби'
-        }
-        
-        self.aspect_names = {
-            'conjunction': 'съвпад', 'sextile': 'секстил',
-            'square': 'квадратура', 'trine': 'тригон', 'opposition': 'опозиция'
-        }
+    # Translation tables are shared constants; instances carry no state
+    __slots__ = ()
+    
+    planet_names = _IdentityDict({
+        'Sun': 'Слънце', 'Moon': 'Луна', 'Mercury': 'Меркурий',
+        'Venus': 'Венера', 'Mars': 'Марс', 'Jupiter': 'Юпитер',
+        'Saturn': 'Сатурн', 'Uranus': 'Уран', 'Neptune': 'Нептун',
+        'Pluto': 'Плутон', 'Node': 'Възходящ Възел', 'Chiron': 'Хирон'
+    })
+    
+    sign_names = SIGN_NAMES
     
-    def generate_docx(self, data: dict) -> bytes:
+    aspect_names = _IdentityDict({
+        'conjunction': 'съвпад', 'sextile': 'секстил',
+        'square': 'квадратура', 'trine': 'тригон', 'opposition': 'опозиция'
+    })
+    
+    def generate_docx(self, data: dict, sink: Optional[BinaryIO] = None) -> Optional[bytes]:
         """
         Generate DOCX report from chart data
         
@@ -50,22 +216,15 @@ class DOCXGenerator:
                 - natal_chart: dict
                 - natal_aspects: list
                 - monthly_results: list[dict{month: str, text: str}]
+            sink: Optional writable binary file-like object. When given, the
+                document is saved straight into it and nothing is returned.
         
         Returns:
-            bytes: DOCX file content
+            bytes: DOCX file content (None when written to sink)
         """
-        doc = Document()
-        
-        # Set default font and spacing (for content pages)
-        style = doc.styles['Normal']
-        font = style.font
-        font.name = 'Arial'
-        font.size = Pt(9)  # Reduced from 13 to 9
-        
-        # Set paragraph spacing - reduced
-        paragraph_format = style.paragraph_format
-        paragraph_format.space_after = Pt(4)  # Reduced from 12
-        paragraph_format.line_spacing = 1.3  # Reduced from 1.8
+        # Fonts and styles are identical for every report; start from a copy of the parsed
+        # skeleton (copying the element trees is cheaper than re-reading the package)
+        doc = deepcopy(_report_skeleton())
         
         # 1. Cover Page
         self._add_cover_page(doc, data)
@@ -78,21 +237,86 @@ class DOCXGenerator:
         
         # 3. Monthly Interpretations
         monthly_results = data.get('monthly_results', [])
-        for idx, month_data in enumerate(monthly_results):
+        # Page break after every month except the last
+        for month_data in monthly_results[:-1]:
             self._add_month_section(doc, month_data)
-            # Only add page break if NOT the last month
-            if idx < len(monthly_results) - 1:
-                doc.add_page_break()
+            doc.add_page_break()
+        if monthly_results:
+            self._add_month_section(doc, monthly_results[-1])
         
         # Add footer to all sections
         self._add_footer(doc, data)
         
+        # Save directly to the caller's sink when provided
+        if sink is not None:
+            if isinstance(sink, RawIOBase):
+                # Unbuffered file: batch the many small ZIP writes into larger chunks
+                buffered = BufferedWriter(sink, buffer_size=DOCX_WRITE_BUFFER_SIZE)
+                try:
+                    doc.save(buffered)
+                except BrokenPipeError:
+                    if not getattr(sink, 'aborted', False):
+                        raise
+                    # Consumer went away mid-save. python-docx leaves its ZipFile unclosed and it
+                    # still writes its end record through `buffered` when released, so the writer
+                    # is not closed here; the aborted sink drops those writes quietly
+                    return None
+                buffered.flush()
+                buffered.detach()
+            else:
+                doc.save(sink)
+            return None
+        
         # Save to BytesIO
         buffer = BytesIO()
         doc.save(buffer)
-        buffer.seek(0)
         return buffer.getvalue()
     
+    async def stream_docx(self, data: dict) -> AsyncIterator[bytes]:
+        """
+        Generate DOCX report and yield it in chunks as it is written
+        
+        Generation runs in a worker thread; only a few DOCX_WRITE_BUFFER_SIZE chunks
+        are held in memory at a time.
+        
+        Args:
+            data: Same as generate_docx
+        
+        Yields:
+            bytes: Consecutive pieces of the DOCX file
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=DOCX_STREAM_QUEUE_SIZE)
+        sink = _QueueSink(loop, queue)
+        
+        def produce():
+            try:
+                self.generate_docx(data, sink)
+            finally:
+                if not sink.aborted:
+                    asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+        
+        producer = asyncio.ensure_future(asyncio.to_thread(produce))
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                yield chunk
+            # Re-raise generation errors
+            await producer
+        finally:
+            if not producer.done():
+                # Consumer stopped early: fail the producer's next write and unblock a pending put
+                sink.aborted = True
+                while not producer.done():
+                    while not queue.empty():
+                        queue.get_nowait()
+                    await asyncio.sleep(0.01)
+                # Retrieve the outcome so an aborted write is not logged as never retrieved
+                with contextlib.suppress(BrokenPipeError):
+                    await producer
+    
     def _add_cover_page(self, doc, data):
         """Create professional cover page"""
         # Main title
@@ -103,7 +327,7 @@ class DOCXGenerator:
         title_run.font.bold = True
         
         # Subtitle - ensure UTF-8 string (no spacer)
-        user_name = str(data.get("user_name", "Неизвестен"))
+        user_name = _as_text(data.get("user_name", "Неизвестен"))
         subtitle = doc.add_heading(f'Подготвен за: {user_name}', level=2)
         subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
         subtitle_run = subtitle.runs[0]
@@ -112,19 +336,18 @@ class DOCXGenerator:
         # Birth info - ensure UTF-8 strings (no spacer)
         birth_para = doc.add_paragraph()
         birth_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        birth_date = str(data.get("birth_date", ""))
-        birth_time = str(data.get("birth_time", ""))
-        birth_city = str(data.get("birth_city", ""))
-        birth_para.add_run(f'Дата на раждане: {birth_date} в {birth_time}\n')
-        birth_para.add_run(f'Място: {birth_city}')
+        birth_para.add_run(
+            f'Дата на раждане: {_as_text(data.get("birth_date"))} в {_as_text(data.get("birth_time"))}\n'
+            f'Място: {_as_text(data.get("birth_city"))}'
+        )
         
         # Separator (no spacers)
-        doc.add_paragraph('_' * 60).alignment = WD_ALIGN_PARAGRAPH.CENTER
+        doc.add_paragraph(_SEPARATOR).alignment = WD_ALIGN_PARAGRAPH.CENTER
         
         # Report type - ensure UTF-8 string (no spacer)
         type_para = doc.add_paragraph()
         type_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        report_type = str(data.get("report_type", "Астрологичен Анализ"))
+        report_type = _as_text(data.get("report_type", "Астрологичен Анализ"))
         type_run = type_para.add_run(f'Тип анализ: {report_type}')
         type_run.font.size = Pt(14)
         type_run.font.color.rgb = RGBColor(100, 100, 100)
@@ -151,29 +374,13 @@ class DOCXGenerator:
         # Create two-column layout using table
         planets = natal_chart.get('planets', {})
         if planets:
-            table = doc.add_table(rows=(len(planets) + 2) // 2, cols=2)
-            table.style = 'Table Grid'  # White background for all rows
-            
-            planet_items = list(planets.items())
-            for idx, (planet_name, planet_data) in enumerate(planet_items):
-                row_idx = idx // 2
-                col_idx = idx % 2
-                cell = table.rows[row_idx].cells[col_idx]
-                
-                planet_bg = self.planet_names.get(planet_name, planet_name)
+            planet_cells = []
+            for planet_name, planet_data in planets.items():
+                planet_bg = self.planet_names[planet_name]
                 position = self._translate_sign(planet_data.get('formatted_pos', ''))
-                
-                # Add text without bold for planet name
-                para = cell.paragraphs[0]
-                para.paragraph_format.space_after = Pt(0)
-                para.paragraph_format.space_before = Pt(0)
-                
-                name_run = para.add_run(f'{planet_bg}: ')
-                name_run.font.size = Pt(9)  # Increased from 8 to 9 (+10%)
-                name_run.font.bold = False  # NOT bold
-                
-                pos_run = para.add_run(position)
-                pos_run.font.size = Pt(9)  # Increased from 8 to 9 (+10%)
+                planet_cells.append([(f'{planet_bg}: ', {'bold': False}), (position, {})])
+            
+            rows = (len(planets) + 2) // 2
             
             # Add Ascendant if available
             angles = natal_chart.get('angles', {})
@@ -181,25 +388,12 @@ class DOCXGenerator:
                 asc_formatted = angles.get('Ascendant_formatted', f"{int(angles.get('Ascendant', 0))}°")
                 asc_translated = self._translate_sign(asc_formatted)
                 
-                # Add to last cell
-                last_row = len(planet_items) // 2
-                last_col = len(planet_items) % 2
-                if last_col == 0:
-                    table.add_row()
-                    last_row += 1
-                    last_col = 0
-                
-                cell = table.rows[last_row].cells[last_col]
-                para = cell.paragraphs[0]
-                para.paragraph_format.space_after = Pt(0)
-                para.paragraph_format.space_before = Pt(0)
-                
-                name_run = para.add_run('Асцендент: ')
-                name_run.font.size = Pt(9)  # Increased from 8 to 9 (+10%)
-                name_run.font.bold = False
-                
-                pos_run = para.add_run(asc_translated)
-                pos_run.font.size = Pt(9)  # Increased from 8 to 9 (+10%)
+                # Add to last cell (a new row is started when the planets fill whole rows)
+                if len(planet_cells) % 2 == 0:
+                    planet_cells.extend([None] * (rows * 2 - len(planet_cells)))
+                planet_cells.append([('Асцендент: ', {'bold': False}), (asc_translated, {})])
+            
+            self._build_table_xml(doc, planet_cells, cols=2, rows=rows)
         
         # 2. Houses (no spacer)
         houses_heading = doc.add_heading('2. ДОМОВЕ', level=3)
@@ -215,49 +409,26 @@ class DOCXGenerator:
                 house_num = planet_data.get('house', 1)
                 if house_num not in planets_by_house:
                     planets_by_house[house_num] = []
-                planets_by_house[house_num].append(self.planet_names.get(planet_name, planet_name))
+                planets_by_house[house_num].append(self.planet_names[planet_name])
         
         # Create two-column table for houses
         if planets_by_house:
-            table = doc.add_table(rows=(12 + 1) // 2, cols=2)
-            table.style = 'Table Grid'  # White background for all rows
-            
+            house_cells = []
             for house_num in range(1, 13):
-                row_idx = (house_num - 1) // 2
-                col_idx = (house_num - 1) % 2
-                cell = table.rows[row_idx].cells[col_idx]
+                suffix = self._get_house_suffix(house_num)
+                house_run = (f'{house_num}-{suffix} дом: ', {'bold': False})
                 
                 planets_list = planets_by_house.get(house_num, [])
                 if planets_list:
-                    suffix = self._get_house_suffix(house_num)
-                    planets_str = ', '.join(planets_list)
-                    
-                    # Add text without bold for house number
-                    para = cell.paragraphs[0]
-                    para.paragraph_format.space_after = Pt(0)
-                    para.paragraph_format.space_before = Pt(0)
-                    
-                    house_run = para.add_run(f'{house_num}-{suffix} дом: ')
-                    house_run.font.size = Pt(9)  # Increased from 8 to 9 (+10%)
-                    house_run.font.bold = False  # NOT bold
-                    
-                    planets_run = para.add_run(planets_str)
-                    planets_run.font.size = Pt(9)  # Increased from 8 to 9 (+10%)
+                    house_cells.append([house_run, (', '.join(planets_list), {})])
                 else:
                     # Empty house - show as "празен"
-                    suffix = self._get_house_suffix(house_num)
-                    para = cell.paragraphs[0]
-                    para.paragraph_format.space_after = Pt(0)
-                    para.paragraph_format.space_before = Pt(0)
-                    
-                    house_run = para.add_run(f'{house_num}-{suffix} дом: ')
-                    house_run.font.size = Pt(9)  # Increased from 8 to 9 (+10%)
-                    house_run.font.bold = False
-                    
-                    empty_run = para.add_run('празен')
-                    empty_run.font.size = Pt(9)  # Increased from 8 to 9 (+10%)
-                    empty_run.font.italic = True
-                    empty_run.font.color.rgb = RGBColor(150, 150, 150)
+                    house_cells.append([
+                        house_run,
+                        ('празен', {'italic': True, 'color': RGBColor(150, 150, 150)})
+                    ])
+            
+            self._build_table_xml(doc, house_cells, cols=2)
         
         # 3. Aspects (no spacer)
         if natal_aspects:
@@ -268,31 +439,111 @@ class DOCXGenerator:
             aspects_heading.paragraph_format.space_after = Pt(2)
             
             # Create three-column table for aspects
-            rows_needed = (len(natal_aspects) + 2) // 3
-            table = doc.add_table(rows=rows_needed, cols=3)
-            table.style = 'Table Grid'  # White background for all rows
+            aspect_cells = []
+            for aspect in natal_aspects:
+                planet1 = self.planet_names[aspect.get('planet1', '')]
+                planet2 = self.planet_names[aspect.get('planet2', '')]
+                aspect_name = self.aspect_names[aspect.get('aspect', '')]
+                aspect_cells.append([(f'{planet1} – {planet2} ', {'bold': False}), (aspect_name, {})])
             
-            for idx, aspect in enumerate(natal_aspects):
-                row_idx = idx // 3
-                col_idx = idx % 3
-                cell = table.rows[row_idx].cells[col_idx]
-                
-                planet1 = self.planet_names.get(aspect.get('planet1', ''), aspect.get('planet1', ''))
-                planet2 = self.planet_names.get(aspect.get('planet2', ''), aspect.get('planet2', ''))
-                aspect_name = self.aspect_names.get(aspect.get('aspect', ''), aspect.get('aspect', ''))
-                
-                # Add text without bold for first planet
-                para = cell.paragraphs[0]
-                para.paragraph_format.space_after = Pt(0)
-                para.paragraph_format.space_before = Pt(0)
+            self._build_table_xml(doc, aspect_cells, cols=3)
+    
+    def _build_table_xml(self, doc, cells, cols, rows=None):
+        """
+        Build a 'Table Grid' table directly as OOXML and append it to the body.
+        
+        Avoids python-docx Table/Cell/Paragraph/Run objects, which re-walk the
+        table XML on every access.
+        
+        Args:
+            doc: Target Document
+            cells: Cells in row-major order; each cell is None (empty) or a list of
+                (text, props) runs where props may hold 'bold', 'italic', 'color'
+            cols: Number of columns
+            rows: Minimum number of rows (defaults to what the cells need)
+        
+        Cell paragraphs use the shared TABLE_CELL_STYLE (9pt, no spacing) instead
+        of per-paragraph spacing and per-run font size.
+        """
+        rows = max(rows or 0, (len(cells) + cols - 1) // cols)
+        col_width = str(Emu(doc._block_width // cols).twips)
+        cell_style_id = doc.styles[TABLE_CELL_STYLE].style_id
+        
+        tbl = OxmlElement('w:tbl')
+        tbl_pr = OxmlElement('w:tblPr')
+        tbl_style = OxmlElement('w:tblStyle')
+        tbl_style.set(qn('w:val'), 'TableGrid')
+        tbl_w = OxmlElement('w:tblW')
+        tbl_w.set(qn('w:type'), 'auto')
+        tbl_w.set(qn('w:w'), '0')
+        tbl_look = OxmlElement('w:tblLook')
+        for attr, val in (('firstColumn', '1'), ('firstRow', '1'), ('lastColumn', '0'),
+                          ('lastRow', '0'), ('noHBand', '0'), ('noVBand', '1'), ('val', '04A0')):
+            tbl_look.set(qn(f'w:{attr}'), val)
+        tbl_pr.append(tbl_style)
+        tbl_pr.append(tbl_w)
+        tbl_pr.append(tbl_look)
+        tbl.append(tbl_pr)
+        
+        tbl_grid = OxmlElement('w:tblGrid')
+        for _ in range(cols):
+            grid_col = OxmlElement('w:gridCol')
+            grid_col.set(qn('w:w'), col_width)
+            tbl_grid.append(grid_col)
+        tbl.append(tbl_grid)
+        
+        # Pad to a full grid once so rows can be sliced without per-cell index math
+        grid = list(cells) + [None] * (rows * cols - len(cells))
+        for row_start in range(0, len(grid), cols):
+            tr = OxmlElement('w:tr')
+            for runs in grid[row_start:row_start + cols]:
+                tc = OxmlElement('w:tc')
+                tc_pr = OxmlElement('w:tcPr')
+                tc_w = OxmlElement('w:tcW')
+                tc_w.set(qn('w:type'), 'dxa')
+                tc_w.set(qn('w:w'), col_width)
+                tc_pr.append(tc_w)
+                tc.append(tc_pr)
                 
-                planet1_run = para.add_run(f'{planet1} – {planet2} ')
-                planet1_run.font.size = Pt(9)  # Increased from 8 to 9 (+10%)
-                planet1_run.font.bold = False  # NOT bold
+                p = OxmlElement('w:p')
+                if runs:
+                    p_pr = OxmlElement('w:pPr')
+                    p_style = OxmlElement('w:pStyle')
+                    p_style.set(qn('w:val'), cell_style_id)
+                    p_pr.append(p_style)
+                    p.append(p_pr)
+                    
+                    for text, props in runs:
+                        r = OxmlElement('w:r')
+                        r_pr = OxmlElement('w:rPr')
+                        if 'bold' in props:
+                            b = OxmlElement('w:b')
+                            if not props['bold']:
+                                b.set(qn('w:val'), '0')
+                            r_pr.append(b)
+                        if props.get('italic'):
+                            r_pr.append(OxmlElement('w:i'))
+                        if props.get('color') is not None:
+                            color = OxmlElement('w:color')
+                            color.set(qn('w:val'), str(props['color']))
+                            r_pr.append(color)
+                        if len(r_pr):
+                            r.append(r_pr)
+                        
+                        t = OxmlElement('w:t')
+                        t.text = text
+                        if text != text.strip():
+                            t.set(qn('xml:space'), 'preserve')
+                        r.append(t)
+                        p.append(r)
                 
-                aspect_run = para.add_run(aspect_name)
-                aspect_run.font.size = Pt(9)  # Increased from 8 to 9 (+10%)
-    
+                tc.append(p)
+                tr.append(tc)
+            tbl.append(tr)
+        
+        # _insert_tbl keeps the table before the body's closing w:sectPr
+        doc.element.body._insert_tbl(tbl)
+
     def _add_month_section(self, doc, month_data):
         """Add monthly interpretation section"""
         # Ensure UTF-8 strings
@@ -302,22 +553,26 @@ class DOCXGenerator:
         # Month title (without emoji for encoding safety)
         # Skip adding month title if it's "Анализ" (static mode - text already has title)
         if month_name != 'Анализ':
-            heading = doc.add_heading(month_name, level=1)
-            heading_run = heading.runs[0]
-            heading_run.font.size = Pt(14)  # Reduced from 22 to 14
-            heading_run.font.color.rgb = RGBColor(139, 92, 246)  # Purple
-            heading.paragraph_format.space_before = Pt(6)
-            heading.paragraph_format.space_after = Pt(4)
+            doc.add_paragraph(month_name, style='AstroMonth')
         
         # Process and add text with formatting
         self._add_formatted_text(doc, month_text)
     
     def _add_formatted_text(self, doc, text):
-        """Add text with markdown-style formatting converted to DOCX"""
-        lines = text.split('\n')
+        """
+        Add text with markdown-style formatting converted to DOCX
+        
+        Paragraphs are built directly as OOXML and inserted into the body, skipping the
+        python-docx Paragraph/Run wrappers and their per-character run text handling.
+        """
+        styles = doc.styles
+        h2_style = styles['AstroH2'].style_id
+        h3_style = styles['AstroH3'].style_id
+        bullet_style = styles['List Bullet'].style_id
+        insert_p = doc.element.body._insert_p
         current_paragraph = None
         
-        for line in lines:
+        for line in text.split('\n'):
             line = line.strip()
             
             # Skip empty lines (no extra spacing)
@@ -325,66 +580,42 @@ class DOCXGenerator:
                 current_paragraph = None
                 continue
             
-            # H2 headers (##)
-            if line.startswith('## '):
-                heading_text = line[3:].strip()
-                heading = doc.add_heading(heading_text, level=2)
-                heading_run = heading.runs[0]
-                heading_run.font.size = Pt(11)  # Reduced from 19 to 11
-                heading_run.font.color.rgb = RGBColor(139, 92, 246)
-                heading.paragraph_format.space_before = Pt(4)
-                heading.paragraph_format.space_after = Pt(2)
-                current_paragraph = None
-                continue
-            
-            # H3 headers (###)
-            if line.startswith('### '):
-                heading_text = line[4:].strip()
-                heading = doc.add_heading(heading_text, level=3)
-                heading_run = heading.runs[0]
-                heading_run.font.size = Pt(10)  # Reduced from 15 to 10
-                heading_run.font.color.rgb = RGBColor(167, 139, 250)
-                heading.paragraph_format.space_before = Pt(3)
-                heading.paragraph_format.space_after = Pt(2)
-                current_paragraph = None
-                continue
-            
-            # Horizontal rule (---)
-            if line.startswith('---'):
-                doc.add_paragraph('_' * 60)
-                current_paragraph = None
-                continue
-            
-            # Bullet points (-)
-            if line.startswith('- '):
-                bullet_text = line[2:].strip()
-                para = doc.add_paragraph(style='List Bullet')
-                self._add_styled_run(para, bullet_text)
+            # Block lines (headings, rules, bullets) also end the running paragraph
+            match = _LINE_PREFIX_RE.match(line)
+            if match:
+                prefix = match.group(0)
+                rest = line[match.end():].strip()
+                if prefix == '## ':
+                    _append_run_xml(insert_p(_paragraph_xml(h2_style)), rest)
+                elif prefix == '### ':
+                    _append_run_xml(insert_p(_paragraph_xml(h3_style)), rest)
+                elif prefix == '---':
+                    _append_run_xml(insert_p(_paragraph_xml()), _SEPARATOR)
+                else:
+                    self._add_styled_run(insert_p(_paragraph_xml(bullet_style)), rest)
                 current_paragraph = None
                 continue
             
             # Regular paragraph
-            if not current_paragraph:
-                current_paragraph = doc.add_paragraph()
+            if current_paragraph is None:
+                current_paragraph = insert_p(_paragraph_xml())
             else:
-                current_paragraph.add_run(' ')
+                _append_run_xml(current_paragraph, ' ')
             
             self._add_styled_run(current_paragraph, line)
     
-    def _add_styled_run(self, paragraph, text):
-        """Add text run with bold formatting (**text**)"""
+    def _add_styled_run(self, p, text):
+        """Append runs to a w:p element with bold formatting (**text**)"""
         # Split by bold markers
-        parts = re.split(r'(\*\*.*?\*\*)', text)
+        parts = _BOLD_RE.split(text)
         
         for part in parts:
             if part.startswith('**') and part.endswith('**'):
                 # Bold text
-                bold_text = part[2:-2]
-                run = paragraph.add_run(bold_text)
-                run.bold = True
-            else:
+                _append_run_xml(p, part[2:-2], bold=True)
+            elif part:
                 # Normal text
-                paragraph.add_run(part)
+                _append_run_xml(p, part)
     
     def _add_footer(self, doc, data):
         """Add footer to all pages"""
@@ -402,22 +633,11 @@ class DOCXGenerator:
     
     def _translate_sign(self, formatted_pos: str) -> str:
         """Translate English sign names to Bulgarian"""
-        translated = formatted_pos
-        for eng_sign, bg_sign in self.sign_names.items():
-            translated = re.sub(eng_sign, bg_sign, translated, flags=re.IGNORECASE)
-        return translated
+        return _translate_sign_text(formatted_pos)
     
     def _get_house_suffix(self, num: int) -> str:
         """Get Bulgarian house suffix"""
-        if num == 1:
-            return 'ви'
-        elif num == 2:
-            return 'ри'
-        elif num == 3:
-            return 'ти'
-        elif num >= 4 and num <= 10:
-            return 'ти'
-        elif num == 11:
-            return 'и'
+        if 1 <= num <= 12:
+            return _HOUSE_SUFFIXES[num - 1]
         return 'ти'
 
@@ -3,13 +3,148 @@
 Извършва изчисления на планетарни позиции и домове
 """
 
+import logging
 import os
+import threading
 import swisseph as swe  # type: ignore
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Dict, Tuple, Optional, List
 from pathlib import Path
+from zoneinfo import ZoneInfo
 from timezonefinder import TimezoneFinder  # type: ignore
-import pytz
+
+
+@lru_cache(maxsize=4096)
+def _calc_ut_cached(jd: float, planet_id: int, flags: int) -> Tuple:
+    """
+    Кеширана обвивка около swe.calc_ut.
+    Транзитните карти често искат едни и същи (jd, планета) за много потребители.
+    """
+    return swe.calc_ut(jd, planet_id, flags)
+
+
+logger = logging.getLogger(__name__)
+
+# Зодиакални знаци по ред (индекс = дължина // 30)
+_SIGNS = (
+    "Aries", "Taurus", "Gemini", "Cancer",
+    "Leo", "Virgo", "Libra", "Scorpio",
+    "Sagittarius", "Capricorn", "Aquarius", "Pisces"
+)
+
+_INV_30 = 1.0 / 30.0
+
+# Управители на знаците (модерни управители за Скорпион, Водолей и Риби)
+SIGN_RULERS = {
+    "Aries": "Mars",
+    "Taurus": "Venus",
+    "Gemini": "Mercury",
+    "Cancer": "Moon",
+    "Leo": "Sun",
+    "Virgo": "Mercury",
+    "Libra": "Venus",
+    "Scorpio": "Pluto",  # Modern ruler (traditional: Mars)
+    "Sagittarius": "Jupiter",
+    "Capricorn": "Saturn",
+    "Aquarius": "Uranus",  # Modern ruler (traditional: Saturn)
+    "Pisces": "Neptune"  # Modern ruler (traditional: Jupiter)
+}
+
+# Същите управители, подредени по индекс на знака (за пътища, които вече имат sign_index)
+_RULERS_BY_INDEX = tuple(SIGN_RULERS[sign] for sign in _SIGNS)
+
+# Фиксиран UTC+2 (EET) за България преди 1979
+_EET_FIXED = timezone(timedelta(hours=2))
+
+# Ключовете на домовете в реда на swe.houses
+_HOUSE_KEYS = tuple(f"House{i}" for i in range(1, 13))
+
+# House1 -> house_1_ruler (ключовете в резултата на get_house_rulers)
+_RULER_KEYS = {key: f"house_{num}_ruler" for num, key in enumerate(_HOUSE_KEYS, 1)}
+
+# Запис за планета, която не може да се изчисли (копира се за всяка карта)
+_EMPTY_PLANET = {
+    "longitude": None,
+    "speed": None,
+    "distance": None,
+    "zodiac_sign": None,
+    "formatted_pos": None
+}
+
+# Пътят, подаден последно на swe.set_ephe_path. Swiss Ephemeris пази състоянието си
+# (път, отворени файлове) в thread-local памет, затова се помни отделно за всяка нишка.
+_ephe_path_state = threading.local()
+
+_timezone_finder: Optional[TimezoneFinder] = None
+_timezone_finder_lock = threading.Lock()
+
+
+def _get_timezone_finder() -> TimezoneFinder:
+    """Споделен TimezoneFinder (тежък обект - зарежда се веднъж за процеса, не за всеки двигател)."""
+    global _timezone_finder
+    if _timezone_finder is None:
+        with _timezone_finder_lock:
+            # Повторна проверка - друга нишка може вече да го е създала
+            if _timezone_finder is None:
+                _timezone_finder = TimezoneFinder()
+    return _timezone_finder
+
+
+def _ensure_ephe_path(ephe_path: str) -> None:
+    """
+    Задава пътя към ефемеридите за текущата нишка, само ако се различава от текущия.
+    swe.set_ephe_path затваря отворените файлове с ефемериди, а двигател се създава
+    при всяко извикване на calculate_chart() на ниво модул.
+    """
+    if getattr(_ephe_path_state, "path", None) != ephe_path:
+        swe.set_ephe_path(ephe_path)
+        _ephe_path_state.path = ephe_path
+
+
+@lru_cache(maxsize=8192)
+def _timezone_at(lat: float, lon: float) -> Optional[str]:
+    """
+    Кеширано търсене на timezone по координати.
+    Повтарящите се градове не минават отново през point-in-polygon търсенето.
+    """
+    return _get_timezone_finder().timezone_at(lat=lat, lng=lon)
+
+
+def _dms_parts(longitude: float) -> Tuple[int, int, int]:
+    """
+    Разлага дължина на (индекс на знака 0-11, градуси в знака, минути).
+    Минутите се закръглят; 60' прехвърля в следващия градус/знак.
+    """
+    # Нормализиране на дължината в диапазона 0-360
+    longitude = longitude % 360.0
+    
+    # Определяне на зодиакалния знак (всеки знак е 30 градуса) - умножение вместо деление
+    sign_index = int(longitude * _INV_30)
+    degrees_in_sign = longitude - sign_index * 30.0
+    # Корекция, ако произведението е закръглено през границата на знака
+    if degrees_in_sign < 0.0:
+        sign_index -= 1
+        degrees_in_sign += 30.0
+    elif degrees_in_sign >= 30.0:
+        sign_index += 1
+        degrees_in_sign -= 30.0
+    # (% 12 покрива longitude == 360.0 от закръгляне при малки отрицателни стойности)
+    sign_index %= 12
+    
+    # Извличане на градуси и минути
+    deg = int(degrees_in_sign)
+    minutes = int(round((degrees_in_sign - deg) * 60))
+    
+    # Корекция ако минутите са 60
+    if minutes >= 60:
+        minutes = 0
+        deg += 1
+        if deg >= 30:
+            deg = 0
+            sign_index = (sign_index + 1) % 12
+    
+    return sign_index, deg, minutes
 
 
 class AstrologyEngine:
@@ -31,6 +166,9 @@ class AstrologyEngine:
         "Chiron": swe.CHIRON
     }
     
+    # Същите двойки (име, id) като кортеж - обхождат се при всяка карта
+    _PLANET_ITEMS = tuple(PLANETS.items())
+    
     # Флагове за изчисления
     CALC_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
     
@@ -46,8 +184,8 @@ class AstrologyEngine:
         
         ephe_path = str(base_dir / "ephe")
         
-        # Задаване на пътя към ефемеридите
-        swe.set_ephe_path(ephe_path)
+        # Задаване на пътя към ефемеридите (за текущата нишка - само ако е различен)
+        _ensure_ephe_path(ephe_path)
         
         # Проверка дали директорията съществува
         if not os.path.exists(ephe_path):
@@ -59,8 +197,8 @@ class AstrologyEngine:
         self.base_dir = base_dir
         self.ephe_path = ephe_path
         
-        # Инициализация на TimezoneFinder (тежък обект, зарежда се веднъж)
-        self.tf = TimezoneFinder()
+        # TimezoneFinder (тежък обект, споделен между всички инстанции)
+        self.tf = _get_timezone_finder()
     
     def _datetime_to_utc(self, date: str, time: str, lat: float, lon: float) -> Tuple[datetime, str]:
         """
@@ -75,47 +213,49 @@ class AstrologyEngine:
         Returns:
             Tuple от (datetime обект в UTC, timezone string)
         """
-        # Нормализиране на формата на датата
+        # Нормализиране на формата на датата и времето (HH:MM -> HH:MM:SS)
         date_clean = date.replace("/", "-")
+        time_clean = time if time.count(":") == 2 else f"{time}:00"
         
-        # Парсиране на датата
-        date_parts = date_clean.split("-")
-        year, month, day = int(date_parts[0]), int(date_parts[1]), int(date_parts[2])
-        
-        # Парсиране на времето
-        time_parts = time.split(":")
-        hour = int(time_parts[0])
-        minute = int(time_parts[1]) if len(time_parts) > 1 else 0
-        second = int(time_parts[2]) if len(time_parts) > 2 else 0
+        # Създаване на локален datetime (naive) - един ISO parse
+        try:
+            local_dt_naive = datetime.fromisoformat(f"{date_clean}T{time_clean}")
+        except ValueError:
+            # Fallback за неподравнени стойности (напр. "1990-1-5", "9:5")
+            date_parts = date_clean.split("-")
+            time_parts = time.split(":")
+            local_dt_naive = datetime(
+                int(date_parts[0]), int(date_parts[1]), int(date_parts[2]),
+                int(time_parts[0]),
+                int(time_parts[1]) if len(time_parts) > 1 else 0,
+                int(time_parts[2]) if len(time_parts) > 2 else 0
+            )
+        year = local_dt_naive.year
         
         # Намиране на timezone от координатите
-        timezone_str = self.tf.timezone_at(lat=lat, lng=lon)
-        
-        if timezone_str is None:
-            # Fallback: използваме UTC ако не можем да намерим timezone
-            timezone_str = "UTC"
-            tz = pytz.UTC
-        else:
-            # Получаване на pytz timezone обект
-            tz = pytz.timezone(timezone_str)
-        
-        # Създаване на локален datetime (naive)
-        local_dt_naive = datetime(year, month, day, hour, minute, second)
+        timezone_str = _timezone_at(lat, lon)
         
         # 🔥 СПЕЦИАЛНО ПРАВИЛО ЗА БЪЛГАРИЯ ПРЕДИ 1979
         # В България смяната на времето (лятно/зимно) е въведена за първи път на 1 април 1979 г.
         # Преди това няма лятно часово време, затова използваме фиксиран UTC+2 (EET)
-        if timezone_str == "Europe/Sofia" and year < 1979:
+        if timezone_str is None:
+            # Fallback: използваме UTC ако не можем да намерим timezone
+            timezone_str = "UTC"
+            local_dt = local_dt_naive.replace(tzinfo=timezone.utc)
+        elif timezone_str == "Europe/Sofia" and year < 1979:
             # През този период НЯМА лятно часово време
-            # Използваме фиксиран UTC+2 (EET)
-            tz = pytz.FixedOffset(120)  # 120 минути = +2 часа
-            local_dt = tz.localize(local_dt_naive)
+            local_dt = local_dt_naive.replace(tzinfo=_EET_FIXED)
         else:
-            # За останалите случаи — стандартно локализиране (правилно обработва DST и исторически промени)
-            local_dt = tz.localize(local_dt_naive)
+            # За останалите случаи — zoneinfo (правилно обработва DST и исторически промени)
+            local_dt = local_dt_naive.replace(tzinfo=ZoneInfo(timezone_str))
+            if local_dt.utcoffset() != local_dt.replace(fold=1).utcoffset() and local_dt.dst() > timedelta(0):
+                # Двусмислен/несъществуващ час около смяната: стандартното време,
+                # (еквивалент на pytz localize с is_dst=False). Сравнява се с > 0, защото
+                # зони с отрицателно DST (Europe/Dublin - зимата е DST -1h) връщат dst() < 0
+                local_dt = local_dt.replace(fold=1)
         
         # Конвертиране в UTC
-        utc_dt = local_dt.astimezone(pytz.UTC)
+        utc_dt = local_dt.astimezone(timezone.utc)
         
         return utc_dt, timezone_str
     
@@ -130,21 +270,7 @@ class AstrologyEngine:
         Returns:
             Име на планетата-управител или None ако знакът е невалиден
         """
-        sign_rulers = {
-            "Aries": "Mars",
-            "Taurus": "Venus",
-            "Gemini": "Mercury",
-            "Cancer": "Moon",
-            "Leo": "Sun",
-            "Virgo": "Mercury",
-            "Libra": "Venus",
-            "Scorpio": "Pluto",  # Modern ruler (traditional: Mars)
-            "Sagittarius": "Jupiter",
-            "Capricorn": "Saturn",
-            "Aquarius": "Uranus",  # Modern ruler (traditional: Saturn)
-            "Pisces": "Neptune"  # Modern ruler (traditional: Jupiter)
-        }
-        return sign_rulers.get(sign)
+        return SIGN_RULERS.get(sign)
     
     def get_house_rulers(self, houses_dict: Dict[str, float]) -> Dict[str, str]:
         """
@@ -159,18 +285,14 @@ class AstrologyEngine:
         house_rulers = {}
         
         for house_name, cusp_longitude in houses_dict.items():
-            # Извличане на номера на дома (House1 -> 1, House2 -> 2, etc.)
-            house_number = int(house_name.replace("House", ""))
-            
-            # Определяне на знака на cusp-а
-            dms_data = self._decimal_to_dms(cusp_longitude)
-            sign = dms_data.get("sign")
+            # Ключ на резултата (House1 -> house_1_ruler, etc.)
+            ruler_key = _RULER_KEYS.get(house_name)
+            if ruler_key is None:
+                ruler_key = f"house_{int(house_name.replace('House', ''))}_ruler"
             
-            # Намиране на управителя
-            if sign:
-                ruler = self.get_house_ruler(sign)
-                if ruler:
-                    house_rulers[f"house_{house_number}_ruler"] = ruler
+            # Знакът на cusp-а (със същото закръгляне като _decimal_to_dms) -> управител
+            sign_index, _, _ = _dms_parts(cusp_longitude)
+            house_rulers[ruler_key] = _RULERS_BY_INDEX[sign_index]
         
         return house_rulers
     
@@ -184,10 +306,8 @@ class AstrologyEngine:
         Returns:
             Tuple от (sign, ruler) или (None, None) ако не е намерен
         """
-        dms_data = self._decimal_to_dms(house_cusp_longitude)
-        sign = dms_data.get("sign")
-        ruler = self.get_house_ruler(sign) if sign else None
-        return (sign, ruler)
+        sign_index, _, _ = _dms_parts(house_cusp_longitude)
+        return (_SIGNS[sign_index], _RULERS_BY_INDEX[sign_index])
     
     def map_planet_to_natal_house(
         self,
@@ -239,13 +359,17 @@ class AstrologyEngine:
         if not user_houses:
             raise ValueError("User natal chart missing 'houses' data")
         
+        # Prepare the user's house ranges once for all partner planets
+        house_ranges = self._house_ranges(user_houses)
+        
         overlays = {}
         for planet_name, planet_data in partner_planets.items():
             longitude = planet_data.get("longitude")
             if longitude is None:
                 continue  # Skip if no position
-            house_num = self.map_planet_to_natal_house(longitude, user_houses)
-            overlays[planet_name] = house_num
+            house_num = self._house_from_ranges(longitude, house_ranges)
+            # Same fallback as map_planet_to_natal_house
+            overlays[planet_name] = house_num if house_num is not None else 1
         return overlays
     
     def map_transit_planets_to_natal_houses(
@@ -282,38 +406,8 @@ class AstrologyEngine:
             - min: Минути (0-59)
             - str: Форматиран string "Sign deg°min'"
         """
-        # Нормализиране на дължината в диапазона 0-360
-        while longitude < 0:
-            longitude += 360
-        while longitude >= 360:
-            longitude -= 360
-        
-        # Определяне на зодиакалния знак (всеки знак е 30 градуса)
-        sign_index = int(longitude / 30)
-        degrees_in_sign = longitude % 30
-        
-        # Списък с зодиакални знаци
-        signs = [
-            "Aries", "Taurus", "Gemini", "Cancer",
-            "Leo", "Virgo", "Libra", "Scorpio",
-            "Sagittarius", "Capricorn", "Aquarius", "Pisces"
-        ]
-        
-        sign = signs[sign_index]
-        
-        # Извличане на градуси и минути
-        deg = int(degrees_in_sign)
-        minutes_decimal = (degrees_in_sign - deg) * 60
-        min = int(round(minutes_decimal))
-        
-        # Корекция ако минутите са 60
-        if min >= 60:
-            min = 0
-            deg += 1
-            if deg >= 30:
-                deg = 0
-                sign_index = (sign_index + 1) % 12
-                sign = signs[sign_index]
+        sign_index, deg, min = _dms_parts(longitude)
+        sign = _SIGNS[sign_index]
         
         # Форматиране на string
         formatted = f"{sign} {deg}°{min:02d}'"
@@ -331,22 +425,13 @@ class AstrologyEngine:
         FIX: Подаваме часа като отделен аргумент (decimal_hour), 
         защото swe.julday изисква денят да е INT.
         """
-        # Извличане на компонентите
-        year = dt.year
-        month = dt.month
-        day = dt.day
-        hour = dt.hour
-        minute = dt.minute
-        second = dt.second
-        
         # Конвертиране на часа в десетично число (напр. 12:30 става 12.5)
-        decimal_hour = hour + (minute / 60.0) + (second / 3600.0)
+        decimal_hour = dt.hour + (dt.minute / 60.0) + (dt.second / 3600.0)
         
         # Изчисляване на Julian Day
         # Синтаксис: swe.julday(year, month, day, hour_float, flag)
-        jd = swe.julday(year, month, day, decimal_hour, swe.GREG_CAL)
-        
-        return jd
+        # (C извикването е по-бързо от същата формула на чист Python)
+        return swe.julday(dt.year, dt.month, dt.day, decimal_hour, swe.GREG_CAL)
 
     def _calculate_planet_position(self, jd: float, planet_id: int) -> Tuple[float, float, float]:
         """
@@ -355,7 +440,7 @@ class AstrologyEngine:
         """
         try:
             # result е tuple: (списък_с_координати, статус_флаг)
-            result = swe.calc_ut(jd, planet_id, self.CALC_FLAGS)
+            result = _calc_ut_cached(jd, planet_id, self.CALC_FLAGS)
             
             # Данните са на позиция 0 (xx), Флагът е на позиция 1
             xx = result[0]
@@ -374,6 +459,22 @@ class AstrologyEngine:
         except Exception as e:
             raise RuntimeError(f"Грешка при изчисляване на планета {planet_id}: {e}")
 
+    def _calculate_all_planets(self, jd: float) -> Dict[str, Optional[Tuple[float, float, float]]]:
+        """
+        Изчислява позициите на всички планети за един Julian Day.
+        
+        Returns:
+            Речник {име: (longitude, speed, distance)}; None за планета, която не може да се изчисли
+        """
+        positions = {}
+        for name, planet_id in self._PLANET_ITEMS:
+            try:
+                positions[name] = self._calculate_planet_position(jd, planet_id)
+            except RuntimeError as e:
+                logger.warning("Предупреждение: %s", e)
+                positions[name] = None
+        return positions
+
     
     def _get_planet_house(self, planet_longitude: float, house_cusps: Dict[str, float]) -> Optional[int]:
         """
@@ -394,37 +495,43 @@ class AstrologyEngine:
         if not house_cusps or planet_longitude is None:
             return None
         
-        # Нормализиране на planet_longitude (0-360)
-        planet_lon = planet_longitude % 360.0
-        
-        # Създаване на списък от домове в правилния ред (House1 до House12)
-        house_cusp_list = []
-        for i in range(1, 13):
-            house_name = f"House{i}"
-            if house_name in house_cusps:
-                cusp = house_cusps[house_name] % 360.0
-                house_cusp_list.append((i, cusp))
+        return self._house_from_ranges(planet_longitude, self._house_ranges(house_cusps))
+    
+    @staticmethod
+    def _house_ranges(house_cusps: Dict[str, float]) -> List[Tuple[int, float, float]]:
+        """
+        Подготвя домовете за търсене: (номер, cusp, cusp на следващия дом), нормализирани 0-360.
+        Изгражда се веднъж на карта, а не за всяка планета.
+        """
+        # Домовете в правилния ред (House1 до House12) - номера и нормализирани cusp-ове
+        house_nums = [num for num, key in enumerate(_HOUSE_KEYS, 1) if key in house_cusps]
+        cusps = [house_cusps[_HOUSE_KEYS[num - 1]] % 360.0 for num in house_nums]
         
-        if not house_cusp_list:
+        # Всеки дом стига до cusp-а на следващия (последният - до първия)
+        return list(zip(house_nums, cusps, cusps[1:] + cusps[:1]))
+    
+    @staticmethod
+    def _house_from_ranges(planet_longitude: float, house_ranges: List[Tuple[int, float, float]]) -> Optional[int]:
+        """Намира дома на планетата по подготвените от _house_ranges диапазони."""
+        if not house_ranges or planet_longitude is None:
             return None
         
+        # Нормализиране на planet_longitude (0-360)
+        planet_lon = planet_longitude % 360.0
+        
         # Проверка за всеки дом в последователен ред
-        for i in range(len(house_cusp_list)):
-            current_house_num, current_cusp = house_cusp_list[i]
-            next_house_num, next_cusp = house_cusp_list[(i + 1) % len(house_cusp_list)]
-            
+        for house_num, current_cusp, next_cusp in house_ranges:
             # Обработка на wrap-around (напр. House12=352°, House1=14°)
             if next_cusp < current_cusp:
                 # Wrap-around case: домът обхваща диапазона от current_cusp до 360° и от 0° до next_cusp
                 if planet_lon >= current_cusp or planet_lon < next_cusp:
-                    return current_house_num
-            else:
+                    return house_num
+            elif current_cusp <= planet_lon < next_cusp:
                 # Normal case: домът обхваща диапазона от current_cusp до next_cusp
-                if current_cusp <= planet_lon < next_cusp:
-                    return current_house_num
+                return house_num
         
         # Fallback: ако не сме намерили (не би трябвало да се случи), връщаме дома с най-близкия cusp
-        closest_house = min(house_cusp_list, key=lambda x: min(
+        closest_house = min(house_ranges, key=lambda x: min(
             abs(x[1] - planet_lon),
             abs((x[1] + 360) - planet_lon),
             abs(x[1] - (planet_lon + 360))
@@ -443,21 +550,14 @@ class AstrologyEngine:
             cusps = result[0]
             ascmc = result[1]
             
-            houses = {}
-            
             # ВАЖНО: Проверка на дължината, за да избегнем IndexError
-            if len(cusps) == 12:
-                # Ако са 12, индексите са 0..11
-                for i in range(12):
-                    houses[f"House{i+1}"] = cusps[i]
-            elif len(cusps) >= 13:
+            # (ключовете идват от готовия _HOUSE_KEYS, без f-string за всеки дом)
+            if len(cusps) >= 13:
                 # Ако са 13, индекс 0 се пропуска, ползваме 1..12
-                for i in range(1, 13):
-                    houses[f"House{i}"] = cusps[i]
+                houses = dict(zip(_HOUSE_KEYS, cusps[1:13]))
             else:
-                # Fallback за всеки случай
-                for i, cusp in enumerate(cusps):
-                    houses[f"House{i+1}"] = cusp
+                # 12 (индекси 0..11) или по-малко за всеки случай
+                houses = dict(zip(_HOUSE_KEYS, cusps))
 
             # Форматиране на ASC и MC
             mc_raw = ascmc[1]
@@ -476,8 +576,8 @@ class AstrologyEngine:
             }
             
         except Exception as e:
-            # Принтираме детайли за дебъг, ако пак гръмне
-            print(f"DEBUG info: cusps type: {type(result[0])}, len: {len(result[0])}")
+            # Детайли за дебъг (форматират се само ако DEBUG е включен)
+            logger.debug("Грешка в swe.houses за jd=%s, lat=%s, lon=%s", jd, lat, lon, exc_info=True)
             raise RuntimeError(f"Грешка при изчисляване на домове: {e}")
     
     def calculate_chart(
@@ -508,56 +608,38 @@ class AstrologyEngine:
                 "datetime_local": "..."
             }
         """
+        # Двигателят може да е създаден в друга нишка (напр. asyncio.to_thread) - пътят е thread-local
+        _ensure_ephe_path(self.ephe_path)
+        
         # Конвертиране на локалното време в UTC базирано на координатите
         dt_utc, timezone_str = self._datetime_to_utc(date, time, lat, lon)
         
         # Конвертиране в Julian Day
         jd = self._datetime_to_julian_day(dt_utc)
         
-        # Изчисляване на позициите на планетите
+        # Изчисляване на домовете (преди планетите, за да се попълни домът им в същия проход)
+        house_data = self._calculate_houses(jd, lat, lon)
+        house_cusps = house_data["houses"]
+        house_ranges = self._house_ranges(house_cusps) if house_cusps else []
+        
+        # Изчисляване на позициите на планетите (всички наведнъж за този jd)
         planets = {}
-        for name, planet_id in self.PLANETS.items():
-            try:
-                longitude, speed, distance = self._calculate_planet_position(jd, planet_id)
+        for name, position in self._calculate_all_planets(jd).items():
+            if position is not None:
+                longitude, speed, distance = position
                 
                 # Форматиране на позицията (Zodiac Sign + Degrees/Minutes)
-                if longitude is not None:
-                    dms_data = self._decimal_to_dms(longitude)
-                    planets[name] = {
-                        "longitude": longitude,
-                        "speed": speed,
-                        "distance": distance,
-                        "zodiac_sign": dms_data["sign"],
-                        "formatted_pos": dms_data["str"]
-                    }
-                else:
-                    planets[name] = {
-                        "longitude": None,
-                        "speed": None,
-                        "distance": None,
-                        "zodiac_sign": None,
-                        "formatted_pos": None
-                    }
-            except Exception as e:
-                print(f"Предупреждение: {e}")
+                dms_data = self._decimal_to_dms(longitude)
                 planets[name] = {
-                    "longitude": None,
-                    "speed": None,
-                    "distance": None,
-                    "zodiac_sign": None,
-                    "formatted_pos": None
+                    "longitude": longitude,
+                    "speed": speed,
+                    "distance": distance,
+                    "zodiac_sign": dms_data["sign"],
+                    "formatted_pos": dms_data["str"],
+                    "house": self._house_from_ranges(longitude, house_ranges)
                 }
-        
-        # Изчисляване на домовете
-        house_data = self._calculate_houses(jd, lat, lon)
-        house_cusps = house_data["houses"]
-        
-        # Изчисляване на дома за всяка планета
-        for name in planets:
-            if planets[name].get("longitude") is not None:
-                planet_longitude = planets[name]["longitude"]
-                house_number = self._get_planet_house(planet_longitude, house_cusps)
-                planets[name]["house"] = house_number
+            else:
+                planets[name] = dict(_EMPTY_PLANET)
         
         # Съставяне на резултата
         result = {
@@ -5,15 +5,17 @@ FastAPI сървър за астрологично приложение
 
 from fastapi import FastAPI, HTTPException, Depends, status  # type: ignore
 from fastapi.middleware.cors import CORSMiddleware  # type: ignore
-from fastapi.responses import StreamingResponse, Response  # type: ignore
+from fastapi.responses import Response, StreamingResponse  # type: ignore
 from pydantic import BaseModel, Field  # type: ignore
 from typing import Optional, List, Dict
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session  # type: ignore
-import json
 import asyncio
+import heapq
+import os
+import orjson
 import engine
-from ai_interpreter import AIInterpreter, get_interpreter
+from ai_interpreter import AIInterpreter, get_interpreter, format_month_bg, MONTHLY_CHUNK_CONCURRENCY
 from scanner import TransitScanner
 from aspects_engine import calculate_natal_aspects
 from docx_generator import DOCXGenerator
@@ -39,6 +41,9 @@ app.add_middleware(
 # Инициализация на AI интерпретатора
 ai_interpreter = get_interpreter()
 
+# DOCX генераторът няма състояние между заявките - една инстанция за целия процес
+docx_generator = DOCXGenerator()
+
 
 def _calculate_max_months_for_token_limit(has_partner: bool = False) -> int:
     """
@@ -61,6 +66,42 @@ def _calculate_max_months_for_token_limit(has_partner: bool = False) -> int:
     return 3  # Индивидуално: максимум 3 месеца
 
 
+# Приоритети на събитията: по-висок номер = по-висок приоритет
+EVENT_PRIORITY_MAP = {
+    "ECLIPSE": 5,
+    "RETROGRADE": 4,
+    "LUNATION": 3,
+    "TRANSIT": 1
+}
+
+# Важни планети за транзити (по-висок приоритет)
+IMPORTANT_NATAL_PLANETS = frozenset({"Sun", "Moon", "Mercury", "Venus", "Mars", "Ascendant", "MC"})
+IMPORTANT_TRANSIT_PLANETS = frozenset({"Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"})
+
+
+def _get_event_priority(event: Dict) -> int:
+    """Връща приоритет на събитие (по-висок = по-важно)"""
+    event_type = event.get("type", "")
+    base_priority = EVENT_PRIORITY_MAP.get(event_type, 0)
+    
+    # Ако е транзит, проверяваме важността на планетите
+    if event_type == "TRANSIT":
+        natal_planet = event.get("natal_planet", "")
+        transit_planet = event.get("planet", "")
+        
+        # Major Transits (Jupiter/Saturn/Uranus/Neptune/Pluto към важни планети)
+        if transit_planet in IMPORTANT_TRANSIT_PLANETS and natal_planet in IMPORTANT_NATAL_PLANETS:
+            return base_priority + 2
+        # Mars към важни планети
+        elif transit_planet == "Mars" and natal_planet in IMPORTANT_NATAL_PLANETS:
+            return base_priority + 1
+        # Други транзити
+        else:
+            return base_priority
+    
+    return base_priority
+
+
 def _filter_and_limit_events(events: List[Dict], max_events: int = 400) -> List[Dict]:
     """
     Филтрира и ограничава timeline events за да намали размера на заявката към AI.
@@ -82,45 +123,23 @@ def _filter_and_limit_events(events: List[Dict], max_events: int = 400) -> List[
     if len(events) <= max_events:
         return events
     
-    # Приоритети: по-висок номер = по-висок приоритет
-    priority_map = {
-        "ECLIPSE": 5,
-        "RETROGRADE": 4,
-        "LUNATION": 3,
-        "TRANSIT": 1
-    }
-    
-    # Важни планети за транзити (по-висок приоритет)
-    important_natal_planets = {"Sun", "Moon", "Mercury", "Venus", "Mars", "Ascendant", "MC"}
-    important_transit_planets = {"Jupiter", "Saturn", "Uranus", "Neptune", "Pluto"}
-    
-    def get_event_priority(event: Dict) -> int:
-        """Връща приоритет на събитие (по-висок = по-важно)"""
-        event_type = event.get("type", "")
-        base_priority = priority_map.get(event_type, 0)
-        
-        # Ако е транзит, проверяваме важността на планетите
-        if event_type == "TRANSIT":
-            natal_planet = event.get("natal_planet", "")
-            transit_planet = event.get("planet", "")
-            
-            # Major Transits (Jupiter/Saturn/Uranus/Neptune/Pluto към важни планети)
-            if transit_planet in important_transit_planets and natal_planet in important_natal_planets:
-                return base_priority + 2
-            # Mars към важни планети
-            elif transit_planet == "Mars" and natal_planet in important_natal_planets:
-                return base_priority + 1
-            # Други транзити
-            else:
-                return base_priority
-        
-        return base_priority
-    
-    # Сортиране по приоритет (най-висок първо), след това по дата
-    sorted_events = sorted(events, key=lambda x: (-get_event_priority(x), x.get("date", "")))
+    # Приоритетите са няколко малки цели числа - групиране по приоритет с по едно извикване
+    # на събитие, вместо сравняване на (приоритет, дата) ключове в heap/сортиране
+    events_by_priority: Dict[int, List[Dict]] = {}
+    for event in events:
+        events_by_priority.setdefault(_get_event_priority(event), []).append(event)
     
-    # Вземане на най-важните събития
-    filtered_events = sorted_events[:max_events]
+    # Най-важните събития (най-висок приоритет първо, след това по дата): цели групи, докато
+    # има място, а от последната група - най-ранните. Същото като sorted(...)[:max_events].
+    filtered_events = []
+    for priority in sorted(events_by_priority, reverse=True):
+        group = events_by_priority[priority]
+        room = max_events - len(filtered_events)
+        if len(group) <= room:
+            filtered_events.extend(group)
+        else:
+            filtered_events.extend(heapq.nsmallest(room, group, key=lambda x: x.get("date", "")))
+            break
     
     # Сортиране отново по дата за финален списък
     filtered_events.sort(key=lambda x: x.get("date", ""))
@@ -221,6 +240,27 @@ class InterpretationResponse(BaseModel):
     partner_natal_aspects: Optional[List[Dict]] = None
 
 
+def _json_response(payload: Dict) -> Response:
+    """
+    Връща вече сериализиран JSON отговор.
+    
+    Данните идват директно от engine/AI интерпретатора и са надеждни - върнат ли се като Response,
+    FastAPI пропуска повторната валидация и сериализация през response_model.
+    response_model остава в декораторите само за OpenAPI документацията.
+    """
+    return Response(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS), media_type="application/json")
+
+
+def _sse_event(payload: Dict) -> bytes:
+    """Сериализира едно Server-Sent Event - orjson връща директно UTF-8 bytes, без допълнително encode."""
+    return b"data: " + orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
+
+
+async def _calculate_chart_async(date: str, time: str, lat: float, lon: float) -> Dict:
+    """Изчислява карта в thread pool, за да не блокира event loop-а на async endpoint-ите."""
+    return await asyncio.to_thread(engine.calculate_chart, date=date, time=time, lat=lat, lon=lon)
+
+
 @app.get("/")
 async def root():
     """Root endpoint - информация за API"""
@@ -256,25 +296,11 @@ async def calculate_chart(request: ChartRequest):
     - Локация
     """
     try:
-        # Изчисляване на картата
-        chart_data = engine.calculate_chart(
-            date=request.date,
-            time=request.time,
-            lat=request.lat,
-            lon=request.lon
-        )
+        # Изчисляване на картата (в thread pool, за да не блокира event loop-а)
+        chart_data = await _calculate_chart_async(request.date, request.time, request.lat, request.lon)
         
-        # Връщане на данните
-        return ChartResponse(
-            planets=chart_data["planets"],
-            houses=chart_data["houses"],
-            angles=chart_data["angles"],
-            julian_day=chart_data["julian_day"],
-            datetime_utc=chart_data["datetime_utc"],
-            timezone=chart_data["timezone"],
-            datetime_local=chart_data["datetime_local"],
-            location=chart_data["location"]
-        )
+        # Връщане на данните (вече сериализирани - FastAPI не валидира повторно отговора)
+        return _json_response(chart_data)
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Невалидни входни данни: {str(e)}")
@@ -301,33 +327,23 @@ async def interpret_chart_stream(request: ChartRequest):
         try:
             # Validate dynamic mode
             if not request.is_dynamic:
-                yield f"data: {json.dumps({'type': 'error', 'message': 'Този endpoint изисква is_dynamic=True'}, ensure_ascii=False)}\n\n"
+                yield _sse_event({'type': 'error', 'message': 'Този endpoint изисква is_dynamic=True'})
                 return
             
             if not request.end_date:
-                yield f"data: {json.dumps({'type': 'error', 'message': 'end_date е задължително за динамична прогноза'}, ensure_ascii=False)}\n\n"
+                yield _sse_event({'type': 'error', 'message': 'end_date е задължително за динамична прогноза'})
                 return
             
-            # Initialize engine
-            engine_instance = engine.AstrologyEngine()
-            
-            # Calculate natal chart
-            natal_chart_data = engine_instance.calculate_chart(
-                date=request.date,
-                time=request.time,
-                lat=request.lat,
-                lon=request.lon
-            )
-            
-            # Calculate partner chart if provided
-            partner_chart_data = None
+            # Calculate natal chart (and partner chart if provided) in parallel, off the event loop
+            chart_jobs = [_calculate_chart_async(request.date, request.time, request.lat, request.lon)]
             if request.partner_date and request.partner_time and request.partner_lat is not None and request.partner_lon is not None:
-                partner_chart_data = engine_instance.calculate_chart(
-                    date=request.partner_date,
-                    time=request.partner_time,
-                    lat=request.partner_lat,
-                    lon=request.partner_lon
-                )
+                chart_jobs.append(_calculate_chart_async(
+                    request.partner_date, request.partner_time, request.partner_lat, request.partner_lon
+                ))
+            
+            charts = await asyncio.gather(*chart_jobs)
+            natal_chart_data = charts[0]
+            partner_chart_data = charts[1] if len(charts) > 1 else None
             
             # Calculate natal aspects for user
             natal_aspects_data = None
@@ -351,13 +367,14 @@ async def interpret_chart_stream(request: ChartRequest):
                 start_date = request.target_date
             else:
                 # Default to current date if no target_date provided
-                from datetime import datetime
                 start_date = datetime.now().strftime("%Y-%m-%d")
             
             end_date = request.end_date
             
             scanner = TransitScanner()
-            all_events = scanner.scan_period(
+            # Сканирането е най-тежката синхронна стъпка - също в thread pool
+            all_events = await asyncio.to_thread(
+                scanner.scan_period,
                 natal_chart=natal_chart_data,
                 start_date=start_date,
                 end_date=end_date,
@@ -368,29 +385,22 @@ async def interpret_chart_stream(request: ChartRequest):
             
             timeline_events = _filter_and_limit_events(all_events)
             
-            # Group events by month
-            from collections import defaultdict
-            events_by_month = defaultdict(list)
+            # Group events by month - timeline_events are already sorted by date
+            # (scan_period + _filter_and_limit_events), so the months appear in order
+            events_by_month = {}
             for event in timeline_events:
                 month_key = event['date'][:7]  # "YYYY-MM"
-                events_by_month[month_key].append(event)
+                events_by_month.setdefault(month_key, []).append(event)
             
-            sorted_months = sorted(events_by_month.keys())
+            sorted_months = list(events_by_month)
             
             if not sorted_months:
-                yield f"data: {json.dumps({'type': 'error', 'message': 'Няма събития за анализиране в избрания период'}, ensure_ascii=False)}\n\n"
+                yield _sse_event({'type': 'error', 'message': 'Няма събития за анализиране в избрания период'})
                 return
             
-            # Month names in Bulgarian
-            month_names = {
-                "01": "Януари", "02": "Февруари", "03": "Март", "04": "Април",
-                "05": "Май", "06": "Юни", "07": "Юли", "08": "Август",
-                "09": "Септември", "10": "Октомври", "11": "Ноември", "12": "Декември"
-            }
-            
             # Send initial metadata with natal chart data
-            start_month = f"{month_names.get(sorted_months[0][5:7], sorted_months[0][5:7])} {sorted_months[0][:4]}"
-            end_month = f"{month_names.get(sorted_months[-1][5:7], sorted_months[-1][5:7])} {sorted_months[-1][:4]}"
+            start_month = format_month_bg(sorted_months[0])
+            end_month = format_month_bg(sorted_months[-1])
             
             # Calculate transit chart for the start date (target_date) for visualization
             # This is needed especially when partner is enabled to show the transit chart
@@ -402,12 +412,7 @@ async def interpret_chart_stream(request: ChartRequest):
                     # Default to noon (12:00) for transit chart
                     transit_time = "12:00:00"
                     
-                    transit_chart_data = engine_instance.calculate_chart(
-                        date=transit_date,
-                        time=transit_time,
-                        lat=request.lat,
-                        lon=request.lon
-                    )
+                    transit_chart_data = await _calculate_chart_async(transit_date, transit_time, request.lat, request.lon)
                 except Exception as e:
                     print(f"Warning: Could not calculate transit chart for start date: {e}")
             
@@ -423,42 +428,75 @@ async def interpret_chart_stream(request: ChartRequest):
                 'partner_natal_aspects': partner_natal_aspects_data
             }
             
-            yield f"data: {json.dumps(start_event_data, ensure_ascii=False)}\n\n"
+            yield _sse_event(start_event_data)
             
-            # Process each month
-            for idx, month in enumerate(sorted_months):
-                monthly_events = events_by_month[month]
-                month_display = f"{month_names.get(month[5:7], month[5:7])} {month[:4]}"
-                
-                # Send month_start event
-                yield f"data: {json.dumps({'type': 'month_start', 'month': month_display, 'index': idx, 'total': len(sorted_months)}, ensure_ascii=False)}\n\n"
-                
-                # Process month with AI interpreter using callback
-                monthly_text = await ai_interpreter._process_monthly_chunk(
-                    month=month,
-                    monthly_events=monthly_events,
-                    report_type=request.report_type or "general",
-                    language="bg",
-                    natal_chart=natal_chart_data,
-                    partner_chart=partner_chart_data,
-                    user_display_name=request.name or "User",
-                    partner_display_name=request.partner_name or "Partner",
-                    question=request.question or "",
-                    has_partner=bool(partner_chart_data)
-                )
-                
-                # Send month_complete event
-                yield f"data: {json.dumps({'type': 'month_complete', 'month': month_display, 'text': monthly_text, 'index': idx, 'total': len(sorted_months)}, ensure_ascii=False)}\n\n"
-                
-                # Small delay to prevent overwhelming the client
-                await asyncio.sleep(0.1)
+            # Статичният контекст (system prompt + натални данни) е еднакъв за всички месеци -
+            # изгражда се веднъж и стои като общ префикс на всяка заявка
+            static_context = ai_interpreter._build_monthly_context(
+                report_type=request.report_type or "general",
+                language="bg",
+                natal_chart=natal_chart_data,
+                partner_chart=partner_chart_data,
+                user_display_name=request.name or "User",
+                partner_display_name=request.partner_name or "Partner",
+                question=request.question or "",
+                has_partner=bool(partner_chart_data)
+            )
+            
+            total_months = len(sorted_months)
+            month_displays = [format_month_bg(month) for month in sorted_months]
+            
+            # Send all month_start events up front - months are processed concurrently
+            for idx, month_display in enumerate(month_displays):
+                yield _sse_event({'type': 'month_start', 'month': month_display, 'index': idx, 'total': total_months})
+            
+            # Месечните AI заявки са независими - пускат се паралелно (ограничени от семафора)
+            semaphore = asyncio.Semaphore(MONTHLY_CHUNK_CONCURRENCY)
+            
+            async def process_month(idx: int, month: str):
+                async with semaphore:
+                    monthly_text = await ai_interpreter._process_monthly_chunk(
+                        month=month,
+                        monthly_events=events_by_month[month],
+                        report_type=request.report_type or "general",
+                        language="bg",
+                        natal_chart=natal_chart_data,
+                        partner_chart=partner_chart_data,
+                        user_display_name=request.name or "User",
+                        partner_display_name=request.partner_name or "Partner",
+                        question=request.question or "",
+                        has_partner=bool(partner_chart_data),
+                        static_context=static_context
+                    )
+                return idx, monthly_text
+            
+            tasks = [asyncio.create_task(process_month(idx, month)) for idx, month in enumerate(sorted_months)]
+            try:
+                # Send month_complete events in completion order (index identifies the month).
+                # Every frame is a self-contained JSON payload: seq is the completion order,
+                # final marks the last month_complete, so clients never need to re-assemble frames.
+                for seq, next_done in enumerate(asyncio.as_completed(tasks)):
+                    idx, monthly_text = await next_done
+                    yield _sse_event({
+                        'type': 'month_complete',
+                        'month': month_displays[idx],
+                        'text': monthly_text,
+                        'index': idx,
+                        'total': total_months,
+                        'seq': seq,
+                        'final': seq == total_months - 1
+                    })
+            finally:
+                # Клиентът може да прекъсне stream-а - недовършените заявки се спират
+                for task in tasks:
+                    task.cancel()
             
             # Send completion event
-            yield f"data: {json.dumps({'type': 'complete'}, ensure_ascii=False)}\n\n"
+            yield _sse_event({'type': 'complete'})
             
         except Exception as e:
             error_message = f"Грешка при генериране на прогноза: {str(e)}"
-            yield f"data: {json.dumps({'type': 'error', 'message': error_message}, ensure_ascii=False)}\n\n"
+            yield _sse_event({'type': 'error', 'message': error_message})
     
     return StreamingResponse(
         generate_monthly_stream(),
@@ -488,13 +526,6 @@ async def interpret_chart(request: ChartRequest):
     - AI интерпретация като текст
     """
     try:
-        natal_chart_data = engine.calculate_chart(
-            date=request.date,
-            time=request.time,
-            lat=request.lat,
-            lon=request.lon
-        )
-        
         # Определяне дали има partner данни
         has_partner = bool(
             request.partner_date and 
@@ -503,8 +534,30 @@ async def interpret_chart(request: ChartRequest):
             request.partner_lon is not None
         )
         
-        # Изчисляване на partner карта (ако е предоставена) - използваме я и за timeline и за synastry
-        partner_chart_data = None
+        # Условна логика за транзитна карта (само ако НЕ е Dynamic Mode)
+        transit_date = None
+        
+        # Проверка дали е заявен транзитен анализ (и НЕ е Dynamic Mode)
+        if request.target_date is not None and not request.is_dynamic:
+            # Определяне на транзитна дата и време
+            transit_date = request.target_date
+            transit_time = request.target_time
+            
+            # Ако датата е предоставена, но часът не е, използваме текущия час
+            if not transit_time:
+                now = datetime.now()
+                transit_time = now.strftime("%H:%M:%S")
+            
+            # Определяне на транзитни координати (за релокация)
+            transit_lat = request.target_lat if request.target_lat is not None else request.lat
+            transit_lon = request.target_lon if request.target_lon is not None else request.lon
+        
+        # Картите са независими - изчисляват се в thread pool, за да не блокират event loop-а
+        chart_jobs = {
+            "natal": _calculate_chart_async(request.date, request.time, request.lat, request.lon)
+        }
+        
+        # Partner карта (ако е предоставена) - използваме я и за timeline и за synastry
         if has_partner:
             # Type narrowing: след проверката на has_partner знаем, че стойностите не са None
             assert request.partner_date is not None, "partner_date is required when has_partner is True"
@@ -512,13 +565,18 @@ async def interpret_chart(request: ChartRequest):
             assert request.partner_lat is not None, "partner_lat is required when has_partner is True"
             assert request.partner_lon is not None, "partner_lon is required when has_partner is True"
             
-            partner_chart_data = engine.calculate_chart(
-                date=request.partner_date,
-                time=request.partner_time,
-                lat=request.partner_lat,
-                lon=request.partner_lon
+            chart_jobs["partner"] = _calculate_chart_async(
+                request.partner_date, request.partner_time, request.partner_lat, request.partner_lon
             )
         
+        if transit_date is not None:
+            chart_jobs["transit"] = _calculate_chart_async(transit_date, transit_time, transit_lat, transit_lon)
+        
+        charts = dict(zip(chart_jobs, await asyncio.gather(*chart_jobs.values())))
+        natal_chart_data = charts["natal"]
+        partner_chart_data = charts.get("partner")
+        transit_chart_data = charts.get("transit")
+        
         # Dynamic Forecast Mode (Timeline Scanner)
         timeline_events = None
         if request.is_dynamic:
@@ -534,64 +592,22 @@ async def interpret_chart(request: ChartRequest):
             
             # Note: Monthly chunking now handles token limits, so we don't restrict period length
             
-            # Изчисляване на partner карта (ако е предоставена) - за Relationship Forecast Mode
-            partner_chart_data_for_timeline = None
-            if has_partner:
-                # Type narrowing: след проверката на has_partner знаем, че стойностите не са None
-                assert request.partner_date is not None, "partner_date is required when has_partner is True"
-                assert request.partner_time is not None, "partner_time is required when has_partner is True"
-                assert request.partner_lat is not None, "partner_lat is required when has_partner is True"
-                assert request.partner_lon is not None, "partner_lon is required when has_partner is True"
-                
-                partner_chart_data_for_timeline = engine.calculate_chart(
-                    date=request.partner_date,
-                    time=request.partner_time,
-                    lat=request.partner_lat,
-                    lon=request.partner_lon
-                )
-            
             # Инициализация на scanner
             scanner = TransitScanner()
-            all_events = scanner.scan_period(
+            # Сканирането е най-тежката синхронна стъпка - също в thread pool
+            all_events = await asyncio.to_thread(
+                scanner.scan_period,
                 natal_chart=natal_chart_data,
                 start_date=start_date,
                 end_date=end_date,
                 lat=request.lat,
                 lon=request.lon,
-                partner_chart=partner_chart_data_for_timeline  # Предаваме partner chart за Relationship Forecast Mode
+                partner_chart=partner_chart_data  # Предаваме partner chart за Relationship Forecast Mode
             )
             
             # Филтриране и ограничаване на събитията за да намалим токените
             timeline_events = _filter_and_limit_events(all_events)
         
-        # Условна логика за транзитна карта (само ако НЕ е Dynamic Mode)
-        transit_chart_data = None
-        transit_date = None
-        
-        # Проверка дали е заявен транзитен анализ (и НЕ е Dynamic Mode)
-        if request.target_date is not None and not request.is_dynamic:
-            # Определяне на транзитна дата и време
-            transit_date = request.target_date
-            transit_time = request.target_time
-            
-            # Ако датата е предоставена, но часът не е, използваме текущия час
-            if not transit_time:
-                now = datetime.now()
-                transit_time = now.strftime("%H:%M:%S")
-            
-            # Определяне на транзитни координати (за релокация)
-            transit_lat = request.target_lat if request.target_lat is not None else request.lat
-            transit_lon = request.target_lon if request.target_lon is not None else request.lon
-            
-            # Изчисляване на транзитна карта
-            transit_chart_data = engine.calculate_chart(
-                date=transit_date,
-                time=transit_time,
-                lat=transit_lat,
-                lon=transit_lon
-            )
-        
-        
         # Получаване на AI интерпретация
         question = request.question or ""
         interpretation = await ai_interpreter.interpret_chart(
@@ -627,53 +643,17 @@ async def interpret_chart(request: ChartRequest):
                 print(f"⚠️ Warning: Could not calculate partner natal aspects: {e}")
                 partner_natal_aspects_data = None
         
-        # Връщане на комбинирания отговор
+        # Връщане на комбинирания отговор (в реда на полетата на InterpretationResponse)
         response_data = {
-            "natal_chart": ChartResponse(
-                planets=natal_chart_data["planets"],
-                houses=natal_chart_data["houses"],
-                angles=natal_chart_data["angles"],
-                julian_day=natal_chart_data["julian_day"],
-                datetime_utc=natal_chart_data["datetime_utc"],
-                timezone=natal_chart_data["timezone"],
-                datetime_local=natal_chart_data["datetime_local"],
-                location=natal_chart_data["location"]
-            ),
-            "transit_chart": None,  # По подразбиране None
+            "natal_chart": natal_chart_data,
+            "transit_chart": transit_chart_data or None,  # None ако не е заявен транзитен анализ
+            "partner_chart": partner_chart_data or None,
             "interpretation": interpretation,
             "natal_aspects": natal_aspects_data,
             "partner_natal_aspects": partner_natal_aspects_data
         }
         
-        # Добавяне на транзитна карта, ако е изчислена
-        if transit_chart_data:
-            response_data["transit_chart"] = ChartResponse(
-                planets=transit_chart_data["planets"],
-                houses=transit_chart_data["houses"],
-                angles=transit_chart_data["angles"],
-                julian_day=transit_chart_data["julian_day"],
-                datetime_utc=transit_chart_data["datetime_utc"],
-                timezone=transit_chart_data["timezone"],
-                datetime_local=transit_chart_data["datetime_local"],
-                location=transit_chart_data["location"]
-            )
-        
-        # Добавяне на partner карта, ако е налична
-        if partner_chart_data:
-            response_data["partner_chart"] = ChartResponse(
-                planets=partner_chart_data["planets"],
-                houses=partner_chart_data["houses"],
-                angles=partner_chart_data["angles"],
-                julian_day=partner_chart_data["julian_day"],
-                datetime_utc=partner_chart_data["datetime_utc"],
-                timezone=partner_chart_data["timezone"],
-                datetime_local=partner_chart_data["datetime_local"],
-                location=partner_chart_data["location"]
-            )
-        
-        # Логване на целия response_data преди създаване на InterpretationResponse
-        response_obj = InterpretationResponse(**response_data)
-        return response_obj
+        return _json_response(response_data)
         
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Невалидни входни данни: {str(e)}")
@@ -712,8 +692,6 @@ async def generate_docx(request: DOCXRequest):
     Generate DOCX report for periods > 6 months
     """
     try:
-        generator = DOCXGenerator()
-        
         # Prepare data for DOCX generation
         docx_data = {
             'user_name': request.user_name,
@@ -726,8 +704,16 @@ async def generate_docx(request: DOCXRequest):
             'monthly_results': request.monthly_results
         }
         
-        # Generate DOCX
-        docx_bytes = generator.generate_docx(docx_data)
+        # Generate DOCX (CPU-bound - в отделна нишка, стриймва се на парчета към клиента)
+        docx_stream = docx_generator.stream_docx(docx_data)
+        # Първото парче идва след като цялото съдържание е построено,
+        # така грешките при генериране все още връщат 500 вместо прекъснат отговор
+        first_chunk = await docx_stream.__anext__()
+        
+        async def docx_body():
+            yield first_chunk
+            async for chunk in docx_stream:
+                yield chunk
         
         # Return DOCX file - URL encode filename for Cyrillic support
         from urllib.parse import quote
@@ -735,8 +721,8 @@ async def generate_docx(request: DOCXRequest):
         filename = f"Astrology_Report_{user_name_safe}_{datetime.now().strftime('%Y-%m-%d')}.docx"
         filename_encoded = quote(filename)
         
-        return Response(
-            content=docx_bytes,
+        return StreamingResponse(
+            docx_body(),
             media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
             headers={
                 "Content-Disposition": f"attachment; filename*=UTF-8''{filename_encoded}"
@@ -794,5 +780,9 @@ def login(user_data: UserLogin, db: Session = Depends(get_db)):
 
 if __name__ == "__main__":
     import uvicorn  # type: ignore
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http "auto" избират uvloop и httptools, когато са инсталирани (uvicorn[standard]).
+    # Изчисляването на картите е CPU-bound и държи GIL-а - няколко worker процеса (2n+1),
+    # броят може да се смени с WEB_CONCURRENCY. За workers uvicorn изисква import string.
+    workers = int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1) + 1))
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, loop="auto", http="auto", workers=workers)
 
@@ -2,11 +2,13 @@
 Transit Scanner - Открива Retrogrades, Eclipses и Transits в период от време
 """
 
+import numpy as np
 import swisseph as swe  # type: ignore
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
-from engine import AstrologyEngine
+from engine import AstrologyEngine, _ensure_ephe_path
 
 
 class TransitScanner:
@@ -47,6 +49,23 @@ class TransitScanner:
         "Neptune": swe.NEPTUNE,
         "Pluto": swe.PLUTO,
     }
+
+    # Натални планети, към които търсим транзити (само важните)
+    NATAL_TARGETS = (
+        "Sun",
+        "Moon",
+        "Mercury",
+        "Venus",
+        "Mars",
+        "Jupiter",
+        "Saturn",
+        "Uranus",
+        "Neptune",
+        "Pluto",
+    )
+
+    # Ред на всяка планета в таблиците с дължини/скорости (INGRESS_PLANETS покрива всички останали)
+    EPHEMERIS_ROWS = {name: row for row, name in enumerate(INGRESS_PLANETS)}
     
     # Аспекти и техните ъгли
     ASPECTS = {
@@ -56,17 +75,24 @@ class TransitScanner:
         "Trine": 120.0,
         "Opposition": 180.0,
     }
+    ASPECT_NAMES = tuple(ASPECTS)
+    ASPECT_ANGLES = np.array(tuple(ASPECTS.values()), dtype=np.float64)
     # Максимални орбиси за транзити:
     # - Приближаващи (applying): 1.5°
     # - Отделящи се (separating): 1.0°
     MAX_ORB_APPLYING = 1.5
     MAX_ORB_SEPARATING = 1.0
     
+    # Проверката на ефемеридите се прави веднъж за процеса, не при всяко изчисление
+    _selftest_done = False
+    
     def __init__(self, base_dir: Path = None):
         """Инициализация на scanner"""
         self.engine = AstrologyEngine(base_dir)
-        # Съхраняваме предишните скорости за откриване на ретрогради
-        self.prev_speeds: Dict[str, float] = {}
+        if not TransitScanner._selftest_done:
+            TransitScanner._selftest_done = True
+            _ensure_ephe_path(self.engine.ephe_path)
+            self._selftest_jupiter_2026()
     
     def _datetime_to_jd(self, dt: datetime) -> float:
         """Конвертира datetime в Julian Day"""
@@ -86,37 +112,60 @@ class TransitScanner:
         return jd
     
     def _get_planet_position(self, jd: float, planet_id: int) -> Tuple[float, float]:
-        """Връща позиция и скорост на планета с валидация"""
+        """Връща позиция и скорост на планета"""
         try:
-            result = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            xx = result[0]
-            longitude = xx[0]
-            speed = xx[3]
-            
-            # Validation for Jupiter position in 2026 (VERIFIED CORRECT)
-            # Jupiter in Cancer during 2026 (retrograde Feb-Jun)
-            # This is CORRECT per Swiss Ephemeris calculations
-            if planet_id == swe.JUPITER:
-                # Convert JD back to date for validation
-                cal = swe.revjul(jd, swe.GREG_CAL)
-                year = cal[0]
-                month = cal[1]
-                
-                if year == 2026 and (month >= 1 and month <= 6):
-                    # Jupiter in Cancer: Jan-Jun 2026 (90° to 120° longitude)
-                    expected_sign = "Cancer"
-                    expected_range = (90, 120)
-                    actual_sign = self._get_sign_name(longitude)
-                    
-                    if actual_sign != expected_sign:
-                        print(f"⚠️ WARNING: Jupiter position unexpected!")
-                        print(f"   Date: {year}-{month:02d}, Expected: {expected_sign}")
-                        print(f"   Actual: {actual_sign} ({longitude:.2f}°)")
-            
-            return longitude, speed
+            xx = swe.calc_ut(jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)[0]
+            return xx[0], xx[3]
         except Exception as e:
             raise RuntimeError(f"Грешка при изчисляване на планета {planet_id}: {e}")
     
+    def _selftest_jupiter_2026(self) -> None:
+        """
+        Еднократна проверка на ефемеридите: Jupiter е в Cancer от януари до юни 2026
+        (ретрограден Feb-Jun; VERIFIED CORRECT по Swiss Ephemeris).
+        """
+        for month in range(1, 7):
+            longitude, _ = self._get_planet_position(swe.julday(2026, month, 1, 0.0, swe.GREG_CAL), swe.JUPITER)
+            actual_sign = self._get_sign_name(longitude)
+            if actual_sign != "Cancer":
+                print(f"⚠️ WARNING: Jupiter position unexpected!")
+                print(f"   Date: 2026-{month:02d}, Expected: Cancer")
+                print(f"   Actual: {actual_sign} ({longitude:.2f}°)")
+    
+    def _build_ephemeris_table(self, jd_start: float, n_days: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Изчислява веднъж дължините и скоростите на INGRESS_PLANETS за n_days поредни дни от jd_start.
+        Връща масиви lon[planet, day] и speed[planet, day]; редовете са по EPHEMERIS_ROWS.
+        Скорост се смята само за RETROGRADE_PLANETS - за останалите редът в speed е NaN.
+
+        swe.calc_ut се вика директно, без try около всяко изчисление - swe.Error се
+        обработва от scan_period, а retflag показва с какви ефемериди е изчислено.
+        """
+        lon_tbl = np.empty((len(self.INGRESS_PLANETS), n_days), dtype=np.float64)
+        spd_tbl = np.full_like(lon_tbl, np.nan)
+        retflags = 0
+        for planet_name, planet_id in self.INGRESS_PLANETS.items():
+            row = self.EPHEMERIS_ROWS[planet_name]
+            lons = lon_tbl[row]
+            if planet_name in self.RETROGRADE_PLANETS:
+                speeds = spd_tbl[row]
+                for day_idx in range(n_days):
+                    xx, retflag = swe.calc_ut(jd_start + day_idx, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+                    lons[day_idx] = xx[0]
+                    speeds[day_idx] = xx[3]
+                    retflags |= retflag
+            else:
+                # Sun/Moon участват само с дължина (лунации, ингреси) - без FLG_SPEED
+                for day_idx in range(n_days):
+                    xx, retflag = swe.calc_ut(jd_start + day_idx, planet_id, swe.FLG_SWIEPH)
+                    lons[day_idx] = xx[0]
+                    retflags |= retflag
+
+        # Без .se1 файловете Swiss Ephemeris минава тихо на Moshier (FLG_MOSEPH в retflag)
+        if retflags & swe.FLG_MOSEPH:
+            print(f"⚠️ WARNING: Swiss Ephemeris files not found in {self.engine.ephe_path}, using Moshier")
+        return lon_tbl, spd_tbl
+    
     def _get_sign_name(self, longitude: float) -> str:
         """Връща име на знак по longitude"""
         signs = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
@@ -124,241 +173,190 @@ class TransitScanner:
         sign_index = int(longitude / 30) % 12
         return signs[sign_index]
     
-    def _normalize_angle(self, angle: float) -> float:
-        """Нормализира ъгъл в диапазона 0-360"""
-        while angle < 0:
-            angle += 360
-        while angle >= 360:
-            angle -= 360
-        return angle
+    def _aspect_orbs(self, transit_lons: np.ndarray, natal_lons: np.ndarray) -> np.ndarray:
+        """
+        Орбис до всеки от ASPECTS за всички двойки транзитна/натална позиция.
+        transit_lons е (transit, day), natal_lons е (natal,); резултатът е (transit, natal, day, aspect).
+        """
+        # Най-късата дистанция между двете точки по кръга
+        raw_diff = np.abs(transit_lons[:, None, :] - natal_lons[None, :, None])
+        diff = np.minimum(raw_diff, 360.0 - raw_diff)
+        return np.abs(diff[..., None] - self.ASPECT_ANGLES)
     
-    def _calculate_aspect_exact(
+    def _detect_retrograde_stations(
         self,
-        transit_long: float,
-        natal_long: float,
-        prev_transit_long: Optional[float] = None,
-    ) -> Optional[Dict]:
+        date_strs: List[str],
+        lon_tbl: np.ndarray,
+        spd_tbl: np.ndarray,
+        events: List[Dict],
+    ) -> None:
         """
-        Строго изчислява аспект между транзитна и натална позиция.
-
-        Връща речник:
-            {
-                "aspect": "Trine",
-                "angle_deg": 120.0,
-                "orb": 0.42,
-                "is_applying": True/False
-            }
-        или None, ако няма аспект в позволените орбиси.
+        Открива ретроградните станции за целия период наведнъж.
+        Колона day_idx в таблиците е датата date_strs[day_idx].
         """
-        # Нормализираме ъглите
-        t = self._normalize_angle(transit_long)
-        n = self._normalize_angle(natal_long)
-
-        # Най-късата дистанция между двете точки по кръга
-        raw_diff = abs(t - n)
-        diff = min(raw_diff, 360.0 - raw_diff)
-
-        best_match: Optional[Dict] = None
-
-        for aspect_name, aspect_angle in self.ASPECTS.items():
-            orb = abs(diff - aspect_angle)
-
-            # За да избегнем грешни "почти аспекти" извън тесните орбиси,
-            # първо определяме дали аспектът е applying или separating (ако имаме предишна позиция).
-            is_applying: Optional[bool] = None
-            if prev_transit_long is not None:
-                prev_t = self._normalize_angle(prev_transit_long)
-                prev_raw_diff = abs(prev_t - n)
-                prev_diff = min(prev_raw_diff, 360.0 - prev_raw_diff)
-                # Ако разстоянието намалява към точния ъгъл – applying,
-                # ако се увеличава – separating.
-                prev_orb = abs(prev_diff - aspect_angle)
-                is_applying = prev_orb > orb
-
-            # Определяме допустимия орбис
-            if is_applying is None:
-                # Ако нямаме предишна точка, използваме по-консервативния лимит (separating)
-                max_orb = self.MAX_ORB_SEPARATING
-            else:
-                max_orb = (
-                    self.MAX_ORB_APPLYING if is_applying else self.MAX_ORB_SEPARATING
+        emit = events.append
+        to_dms = self.engine._decimal_to_dms
+        for planet_name in self.RETROGRADE_PLANETS:
+            row = self.EPHEMERIS_ROWS[planet_name]
+            speed = spd_tbl[row]
+
+            # Stationary Retrograde: от положителна към отрицателна скорост
+            # Stationary Direct: от отрицателна към положителна скорост
+            to_retrograde = (speed[:-1] > 0) & (speed[1:] < 0)
+            to_direct = (speed[:-1] < 0) & (speed[1:] > 0)
+
+            for day_idx in (np.flatnonzero(to_retrograde | to_direct) + 1).tolist():
+                direction = "retrograde" if to_retrograde[day_idx - 1] else "direct"
+                pos_data = to_dms(float(lon_tbl[row, day_idx]))
+                emit(
+                    {
+                        "date": date_strs[day_idx],
+                        "type": "RETROGRADE",
+                        "planet": planet_name,
+                        "direction": direction,
+                        "event": f"{planet_name} turns {direction.capitalize()} in {pos_data['sign']}",
+                        "description": f"{planet_name} turns {direction.capitalize()} in {pos_data['sign']}",
+                        "position": pos_data["str"],
+                    }
                 )
-
-            if orb <= max_orb:
-                # Ако има повече от един аспект в обхват (рядко, но възможно при граници),
-                # избираме този с най-малка орбис.
-                if best_match is None or orb < best_match["orb"]:
-                    best_match = {
-                        "aspect": aspect_name,
-                        "angle_deg": aspect_angle,
-                        "orb": round(orb, 4),
-                        "is_applying": bool(is_applying) if is_applying is not None else False,
+    
+    def _detect_ingresses(self, date_strs: List[str], lon_tbl: np.ndarray, events: List[Dict]) -> None:
+        """
+        Открива INGRES събития (планета влиза в нов знак) за целия период наведнъж.
+        Колона day_idx в таблиците е датата date_strs[day_idx].
+        """
+        # swe.calc_ut връща дължини в [0, 360), така че // 30 е индексът на знака
+        sign_tbl = (lon_tbl // 30).astype(np.int8)
+
+        emit = events.append
+        to_dms = self.engine._decimal_to_dms
+        for planet_name, row in self.EPHEMERIS_ROWS.items():
+            signs = sign_tbl[row]
+            # Планетата е влязла в нов знак между предишния и текущия ден
+            for day_idx in (np.flatnonzero(signs[1:] != signs[:-1]) + 1).tolist():
+                pos_data = to_dms(float(lon_tbl[row, day_idx]))
+                emit(
+                    {
+                        "date": date_strs[day_idx],
+                        "type": "INGRESS",
+                        "planet": planet_name,
+                        "sign": pos_data["sign"],
+                        "event": f"{planet_name} enters {pos_data['sign']}",
+                        "description": f"{planet_name} enters {pos_data['sign']}",
+                        "position": pos_data["str"],
                     }
-
-        return best_match
+                )
     
-    def _detect_retrograde_stations(self, date: datetime, events: List[Dict]) -> None:
-        """Открива ретроградни станции за датата"""
-        jd = self._datetime_to_jd(date)
-        
-        for planet_name, planet_id in self.RETROGRADE_PLANETS.items():
-            try:
-                _, speed = self._get_planet_position(jd, planet_id)
-                
-                # Проверка за промяна в посоката
-                if planet_name in self.prev_speeds:
-                    prev_speed = self.prev_speeds[planet_name]
-                    
-                    # Stationary Retrograde: от положителна към отрицателна скорост
-                    if prev_speed > 0 and speed < 0:
-                        longitude, _ = self._get_planet_position(jd, planet_id)
-                        pos_data = self.engine._decimal_to_dms(longitude)
-                        events.append(
-                            {
-                                "date": date.strftime("%Y-%m-%d"),
-                                "type": "RETROGRADE",
-                                "planet": planet_name,
-                                "direction": "retrograde",
-                                "event": f"{planet_name} turns Retrograde in {pos_data['sign']}",
-                                "description": f"{planet_name} turns Retrograde in {pos_data['sign']}",
-                                "position": pos_data["str"],
-                            }
-                        )
-                    
-                    # Stationary Direct: от отрицателна към положителна скорост
-                    elif prev_speed < 0 and speed > 0:
-                        longitude, _ = self._get_planet_position(jd, planet_id)
-                        pos_data = self.engine._decimal_to_dms(longitude)
-                        events.append(
-                            {
-                                "date": date.strftime("%Y-%m-%d"),
-                                "type": "RETROGRADE",
-                                "planet": planet_name,
-                                "direction": "direct",
-                                "event": f"{planet_name} turns Direct in {pos_data['sign']}",
-                                "description": f"{planet_name} turns Direct in {pos_data['sign']}",
-                                "position": pos_data["str"],
-                            }
-                        )
-                
-                # Запазване на текущата скорост за следващия ден
-                self.prev_speeds[planet_name] = speed
-                
-            except Exception as e:
-                print(f"Грешка при откриване на ретрограда за {planet_name}: {e}")
-                continue
+    def _find_eclipses(
+        self,
+        next_eclipse_jd: Callable[[float], float],
+        jd_from: float,
+        jd_to: float,
+    ) -> np.ndarray:
+        """
+        Последователните затъмнения (JD на максимума) след jd_from, до първото след jd_to включително.
+        next_eclipse_jd(jd) връща максимума на следващото затъмнение след jd.
+        """
+        eclipse_jds = []
+        jd = jd_from
+        try:
+            while True:
+                eclipse_jd = next_eclipse_jd(jd)
+                eclipse_jds.append(eclipse_jd)
+                if eclipse_jd > jd_to:
+                    break
+                # Две затъмнения от един вид са на поне няколко седмици разстояние
+                jd = eclipse_jd + 1.0
+        except Exception as e:
+            print(f"Грешка при търсене на затъмнения: {e}")
+        return np.array(eclipse_jds, dtype=np.float64)
+    
+    def _is_eclipse_day(self, eclipse_jds: np.ndarray, jd: float, day_ordinal: int) -> bool:
+        """Дали следващото затъмнение след предишния ден (jd - 1) е в рамките на 1 ден от датата"""
+        idx = int(np.searchsorted(eclipse_jds, jd - 1, side="right"))
+        if idx == len(eclipse_jds):
+            return False
+        # Конвертиране на Julian Day към datetime
+        # JD 2440587.5 = 1970-01-01 00:00:00 UTC
+        days_since_epoch = float(eclipse_jds[idx]) - 2440587.5
+        eclipse_date = datetime.fromtimestamp(days_since_epoch * 86400.0, tz=None)
+        return abs(eclipse_date.toordinal() - day_ordinal) <= 1
     
-    def _detect_lunations_and_eclipses(self, date: datetime, lat: float, lon: float, events: List[Dict]) -> None:
-        """Открива New Moon, Full Moon и Eclipses"""
-        jd = self._datetime_to_jd(date)
+    def _detect_lunations_and_eclipses(
+        self,
+        date_str: str,
+        day_ordinal: int,
+        jd: float,
+        day_idx: int,
+        lon_tbl: np.ndarray,
+        solar_eclipse_jds: np.ndarray,
+        lunar_eclipse_jds: np.ndarray,
+        events: List[Dict],
+    ) -> None:
+        """Открива New Moon, Full Moon и Eclipses (jd е Julian Day на датата)"""
+        sun_long = float(lon_tbl[self.EPHEMERIS_ROWS["Sun"], day_idx])
+        moon_long = float(lon_tbl[self.EPHEMERIS_ROWS["Moon"], day_idx])
         
-        try:
-            sun_long, _ = self._get_planet_position(jd, swe.SUN)
-            moon_long, _ = self._get_planet_position(jd, swe.MOON)
-            
-            # Изчисляване на разстоянието между Слънцето и Луната
-            separation = abs(sun_long - moon_long)
-            separation = min(separation, 360 - separation)  # Най-малкото разстояние
-            
-            # New Moon (0° ± 13°)
-            if separation < 13.0:
-                # Проверка за Solar Eclipse
-                try:
-                    # swe.sol_eclipse_when_loc намира следващото слънчево затъмнение
-                    # Използваме го за проверка дали има затъмнение близо до тази дата
-                    ret = swe.sol_eclipse_when_loc(
-                        jd - 1,  # Търсим от предишния ден
-                        swe.FLG_SWIEPH,
-                        lat, lon, 0,  # altitude = 0
-                        0  # backward = 0 (търси напред)
-                    )
-                    
-                    if ret[0] >= 0:  # Успешно намерено затъмнение
-                        eclipse_jd = ret[1][0]
-                        # Конвертиране на Julian Day към datetime
-                        # JD 2440587.5 = 1970-01-01 00:00:00 UTC
-                        days_since_epoch = eclipse_jd - 2440587.5
-                        eclipse_timestamp = days_since_epoch * 86400.0
-                        eclipse_date = datetime.fromtimestamp(eclipse_timestamp, tz=None)
-                        
-                        # Проверка дали затъмнението е в рамките на 1 ден от текущата дата
-                        date_diff = abs((eclipse_date.date() - date.date()).days)
-                        if date_diff <= 1:
-                            sun_pos = self.engine._decimal_to_dms(sun_long)
-                            events.append({
-                                "date": date.strftime("%Y-%m-%d"),
-                                "type": "ECLIPSE",
-                                "planet": "Sun/Moon",
-                                "event": f"Solar Eclipse in {sun_pos['sign']}",
-                                "position": sun_pos["str"]
-                            })
-                            return  # Не добавяме New Moon, ако е затъмнение
-                except:
-                    pass  # Ако няма затъмнение, продължаваме
-                
-                # Обикновен New Moon
-                sun_pos = self.engine._decimal_to_dms(sun_long)
-                events.append({
-                    "date": date.strftime("%Y-%m-%d"),
-                    "type": "LUNATION",
-                    "planet": "Sun/Moon",
-                    "event": f"New Moon in {sun_pos['sign']}",
-                    "position": sun_pos["str"]
-                })
-            
-            # Full Moon (180° ± 13°)
-            elif separation > 167.0:
-                # Проверка за Lunar Eclipse
-                try:
-                    ret = swe.lun_eclipse_when(
-                        jd - 1,
-                        swe.FLG_SWIEPH,
-                        0  # backward = 0
-                    )
-                    
-                    if ret[0] >= 0:
-                        eclipse_jd = ret[1][0]
-                        # Конвертиране на Julian Day към datetime
-                        days_since_epoch = eclipse_jd - 2440587.5
-                        eclipse_timestamp = days_since_epoch * 86400.0
-                        eclipse_date = datetime.fromtimestamp(eclipse_timestamp, tz=None)
-                        
-                        date_diff = abs((eclipse_date.date() - date.date()).days)
-                        if date_diff <= 1:
-                            moon_pos = self.engine._decimal_to_dms(moon_long)
-                            events.append({
-                                "date": date.strftime("%Y-%m-%d"),
-                                "type": "ECLIPSE",
-                                "planet": "Sun/Moon",
-                                "event": f"Lunar Eclipse in {moon_pos['sign']}",
-                                "position": moon_pos["str"]
-                            })
-                            return
-                except:
-                    pass
-                
-                # Обикновен Full Moon
-                moon_pos = self.engine._decimal_to_dms(moon_long)
-                events.append({
-                    "date": date.strftime("%Y-%m-%d"),
-                    "type": "LUNATION",
-                    "planet": "Sun/Moon",
-                    "event": f"Full Moon in {moon_pos['sign']}",
-                    "position": moon_pos["str"]
-                })
+        # Изчисляване на разстоянието между Слънцето и Луната
+        separation = abs(sun_long - moon_long)
+        separation = min(separation, 360 - separation)  # Най-малкото разстояние
         
-        except Exception as e:
-            print(f"Грешка при откриване на лунации/затъмнения: {e}")
+        # New Moon (0° ± 13°)
+        if separation < 13.0:
+            sun_pos = self.engine._decimal_to_dms(sun_long)
+            # Не добавяме New Moon, ако е затъмнение
+            if self._is_eclipse_day(solar_eclipse_jds, jd, day_ordinal):
+                event_type, event = "ECLIPSE", f"Solar Eclipse in {sun_pos['sign']}"
+            else:
+                event_type, event = "LUNATION", f"New Moon in {sun_pos['sign']}"
+            events.append({
+                "date": date_str,
+                "type": event_type,
+                "planet": "Sun/Moon",
+                "event": event,
+                "position": sun_pos["str"]
+            })
+        
+        # Full Moon (180° ± 13°)
+        elif separation > 167.0:
+            moon_pos = self.engine._decimal_to_dms(moon_long)
+            if self._is_eclipse_day(lunar_eclipse_jds, jd, day_ordinal):
+                event_type, event = "ECLIPSE", f"Lunar Eclipse in {moon_pos['sign']}"
+            else:
+                event_type, event = "LUNATION", f"Full Moon in {moon_pos['sign']}"
+            events.append({
+                "date": date_str,
+                "type": event_type,
+                "planet": "Sun/Moon",
+                "event": event,
+                "position": moon_pos["str"]
+            })
+    
+    def _natal_targets(self, natal_chart: Dict) -> Tuple[List[str], np.ndarray]:
+        """Имената и дължините (като масив) на наталните планети, към които търсим транзити"""
+        natal_planets = natal_chart.get("planets", {})
+        natal_names = [
+            name for name in self.NATAL_TARGETS
+            if name in natal_planets and natal_planets[name].get("longitude") is not None
+        ]
+        natal_lons = np.array([natal_planets[name]["longitude"] for name in natal_names], dtype=np.float64)
+        return natal_names, natal_lons
     
     def _detect_transits_to_natal(
         self,
-        date: datetime,
-        natal_chart: Dict,
+        date_strs: List[str],
+        lon_tbl: np.ndarray,
+        natal_names: List[str],
+        natal_lons: np.ndarray,
+        house_cusps: np.ndarray,
+        house_labels: List[str],
         events: List[Dict],
         target: str = "User",
     ) -> None:
         """
-        Открива транзити към наталната карта по СТРОГИ математически правила.
+        Открива транзити към наталната карта по СТРОГИ математически правила за целия период.
+        natal_names/natal_lons са наталните цели от _natal_targets (успоредни),
+        house_cusps/house_labels са наталните домове от _house_cusps.
 
         - Аспекти: Conjunction (0°), Sextile (60°), Square (90°), Trine (120°), Opposition (180°)
         - Орбис:
@@ -370,98 +368,73 @@ class TransitScanner:
             - angle_deg: точният аспектен ъгъл (0/60/90/120/180)
             - orb: разлика в градуси от точен аспект
         """
-        jd = self._datetime_to_jd(date)
-        jd_prev = jd - 1.0  # един ден назад, за да различим applying/separating
-
-        # Натални планети за сравнение
-        natal_planets = natal_chart.get("planets", {})
-
-        # Проверяваме само важните натални планети
-        natal_targets = [
-            "Sun",
-            "Moon",
-            "Mercury",
-            "Venus",
-            "Mars",
-            "Jupiter",
-            "Saturn",
-            "Uranus",
-            "Neptune",
-            "Pluto",
-        ]
-
-        for transit_planet_name, transit_planet_id in self.TRANSIT_PLANETS.items():
-            try:
-                transit_long, _ = self._get_planet_position(jd, transit_planet_id)
-                prev_transit_long, _ = self._get_planet_position(jd_prev, transit_planet_id)
-
-                # Сравняваме с наталните планети
-                for natal_planet_name in natal_targets:
-                    if natal_planet_name not in natal_planets:
-                        continue
-
-                    natal_long = natal_planets[natal_planet_name]["longitude"]
-
-                    # Строго изчисляване на аспект
-                    aspect_info = self._calculate_aspect_exact(
-                        transit_long=transit_long,
-                        natal_long=natal_long,
-                        prev_transit_long=prev_transit_long,
-                    )
-
-                    if not aspect_info:
-                        continue
-
-                    transit_pos = self.engine._decimal_to_dms(transit_long)
-                    natal_pos = self.engine._decimal_to_dms(natal_long)
-
-                    house_impact = self._find_house_for_position(transit_long, natal_chart)
-
-                    events.append(
-                        {
-                            "date": date.strftime("%Y-%m-%d"),
-                            "type": "TRANSIT",
-                            "target": target,  # "User" или "Partner"
-                            "planet": transit_planet_name,
-                            "natal_planet": natal_planet_name,
-                            "aspect": aspect_info["aspect"],
-                            "angle_deg": aspect_info["angle_deg"],
-                            "orb": round(aspect_info["orb"], 2),
-                            "is_applying": aspect_info["is_applying"],
-                            "transit_position": transit_pos["str"],
-                            "natal_position": natal_pos["str"],
-                            "house_impact": house_impact,
-                            "description": f"Transit {transit_planet_name} {aspect_info['aspect']} NATAL {natal_planet_name} (House {house_impact})",
-                        }
-                    )
-
-            except Exception as e:
-                print(f"Грешка при откриване на транзит за {transit_planet_name}: {e}")
-                continue
+        if not natal_names:
+            return
+        natal_longs = natal_lons.tolist()
+
+        # Колона day_idx е датата date_strs[day_idx]; предишната колона
+        # е денят преди нея, за да различим applying/separating
+        transit_tbl = lon_tbl[[self.EPHEMERIS_ROWS[name] for name in self.TRANSIT_PLANETS]]
+        orb = self._aspect_orbs(transit_tbl[:, 1:], natal_lons)
+        prev_orb = self._aspect_orbs(transit_tbl[:, :-1], natal_lons)
+
+        # Ако разстоянието намалява към точния ъгъл – applying, ако се увеличава – separating
+        is_applying = prev_orb > orb
+        in_orb = orb <= np.where(is_applying, self.MAX_ORB_APPLYING, self.MAX_ORB_SEPARATING)
+        # Ако има повече от един аспект в обхват, избираме този с най-малка орбис
+        best = np.argmin(np.where(in_orb, orb, np.inf), axis=-1)
+
+        transit_names = tuple(self.TRANSIT_PLANETS)
+        # Наталните позиции не зависят от деня - форматират се веднъж
+        to_dms = self.engine._decimal_to_dms
+        natal_positions = [to_dms(natal_long)["str"] for natal_long in natal_longs]
+        emit = events.append
+        # np.argwhere обхожда (transit, natal, day) в този ред - след стабилното
+        # сортиране по дата събитията от един ден остават подредени по планети
+        for t_idx, n_idx, day in np.argwhere(in_orb.any(axis=-1)).tolist():
+            a_idx = best[t_idx, n_idx, day]
+            transit_planet_name = transit_names[t_idx]
+            natal_planet_name = natal_names[n_idx]
+            aspect_name = self.ASPECT_NAMES[a_idx]
+            transit_long = float(transit_tbl[t_idx, day + 1])
+
+            transit_pos = to_dms(transit_long)
+
+            house_impact = self._find_house_for_position(transit_long, house_cusps, house_labels)
+
+            emit(
+                {
+                    "date": date_strs[day + 1],
+                    "type": "TRANSIT",
+                    "target": target,  # "User" или "Partner"
+                    "planet": transit_planet_name,
+                    "natal_planet": natal_planet_name,
+                    "aspect": aspect_name,
+                    "angle_deg": self.ASPECTS[aspect_name],
+                    "orb": round(round(float(orb[t_idx, n_idx, day, a_idx]), 4), 2),
+                    "is_applying": bool(is_applying[t_idx, n_idx, day, a_idx]),
+                    "transit_position": transit_pos["str"],
+                    "natal_position": natal_positions[n_idx],
+                    "house_impact": house_impact,
+                    "description": f"Transit {transit_planet_name} {aspect_name} NATAL {natal_planet_name} (House {house_impact})",
+                }
+            )
     
-    def _find_house_for_position(self, longitude: float, natal_chart: Dict) -> str:
-        """Намира в кой натален дом попада позицията"""
+    def _house_cusps(self, natal_chart: Dict) -> Tuple[np.ndarray, List[str]]:
+        """Наталните куспиди, сортирани по дължина, и успоредните им етикети ("1".."12")"""
         houses = natal_chart.get("angles", {}).get("houses", {})
-        
-        if not houses:
+        house_list = sorted(houses.items(), key=lambda x: x[1])
+        house_cusps = np.array([cusp for _, cusp in house_list], dtype=np.float64)
+        house_labels = [house_name.replace("House", "") for house_name, _ in house_list]
+        return house_cusps, house_labels
+    
+    def _find_house_for_position(self, longitude: float, house_cusps: np.ndarray, house_labels: List[str]) -> str:
+        """Намира в кой натален дом попада позицията (по резултата от _house_cusps)"""
+        if not house_labels:
             return "Unknown"
-        
-        # Сортиране на домовете по дължина
-        house_list = []
-        for house_name, house_cusp in houses.items():
-            house_list.append((house_name, house_cusp))
-        
-        house_list.sort(key=lambda x: x[1])
-        
-        # Намиране на дома
-        for i, (house_name, house_cusp) in enumerate(house_list):
-            next_house_cusp = house_list[(i + 1) % len(house_list)][1]
-            
-            # Проверка дали позицията е между тези два дома
-            if house_cusp <= longitude < next_house_cusp or (next_house_cusp < house_cusp and (longitude >= house_cusp or longitude < next_house_cusp)):
-                return house_name.replace("House", "")
-        
-        return "1"  # Default
+        # Последният куспид <= позицията; преди първия куспид е последният дом (преход през 0°)
+        idx = int(np.searchsorted(house_cusps, longitude, side="right")) - 1
+        return house_labels[idx]
     
     def scan_period(
         self,
@@ -482,82 +455,65 @@ class TransitScanner:
         """
         events: List[Dict] = []
 
+        # Пътят към ефемеридите е thread-local в Swiss Ephemeris - сканирането може да е в друга нишка
+        _ensure_ephe_path(self.engine.ephe_path)
+
         # Парсиране на датите
         start_dt = datetime.strptime(start_date, "%Y-%m-%d")
         end_dt = datetime.strptime(end_date, "%Y-%m-%d")
 
-        # Инициализация на предишните скорости (използваме ден преди началната дата)
-        init_date = start_dt - timedelta(days=1)
-        init_jd = self._datetime_to_jd(init_date)
-
-        for planet_name, planet_id in self.RETROGRADE_PLANETS.items():
-            try:
-                _, speed = self._get_planet_position(init_jd, planet_id)
-                self.prev_speeds[planet_name] = speed
-            except Exception:
-                self.prev_speeds[planet_name] = 0.0
-
-        # Инициализация на предишните знаци за INGRES детекция
-        prev_signs: Dict[str, int] = {}
-        for planet_name, planet_id in self.INGRESS_PLANETS.items():
-            try:
-                long_init, _ = self._get_planet_position(init_jd, planet_id)
-                prev_signs[planet_name] = int(self._normalize_angle(long_init) // 30)
-            except Exception:
-                prev_signs[planet_name] = -1
-
-        # Итерация през всеки ден
-        current_date = start_dt
-        while current_date <= end_dt:
-            # Откриване на ретрогради (общи за всички)
-            self._detect_retrograde_stations(current_date, events)
+        # Дължини и скорости за целия период се изчисляват еднократно.
+        # Колона 0 е денят преди началната дата - от нея тръгват предишните скорости и знаци.
+        n_days = max((end_dt - start_dt).days + 1, 0)
+        init_dt = start_dt - timedelta(days=1)
+        init_jd = self._datetime_to_jd(init_dt)
 
-            # Откриване на лунации и затъмнения (общи за всички)
-            self._detect_lunations_and_eclipses(current_date, lat, lon, events)
-
-            # Откриване на INGRES събития (планета влиза в нов знак)
-            jd_current = self._datetime_to_jd(current_date)
-            for planet_name, planet_id in self.INGRESS_PLANETS.items():
-                try:
-                    long_now, _ = self._get_planet_position(jd_current, planet_id)
-                    normalized = self._normalize_angle(long_now)
-                    current_sign_index = int(normalized // 30)
-
-                    prev_sign_index = prev_signs.get(planet_name, current_sign_index)
-                    if current_sign_index != prev_sign_index:
-                        # Планетата е влязла в нов знак между предишния и текущия ден
-                        pos_data = self.engine._decimal_to_dms(normalized)
-                        events.append(
-                            {
-                                "date": current_date.strftime("%Y-%m-%d"),
-                                "type": "INGRESS",
-                                "planet": planet_name,
-                                "sign": pos_data["sign"],
-                                "event": f"{planet_name} enters {pos_data['sign']}",
-                                "description": f"{planet_name} enters {pos_data['sign']}",
-                                "position": pos_data["str"],
-                            }
-                        )
-
-                    prev_signs[planet_name] = current_sign_index
-                except Exception as e:
-                    print(f"Грешка при откриване на ingress за {planet_name}: {e}")
-
-            # Откриване на транзити за User
+        # Ординалът и "YYYY-MM-DD" на всяка колона се изчисляват веднъж, не за всяко събитие
+        day_ordinals = range(init_dt.toordinal(), init_dt.toordinal() + n_days + 1)
+        date_strs = [datetime.fromordinal(ordinal).strftime("%Y-%m-%d") for ordinal in day_ordinals]
+        try:
+            lon_tbl, spd_tbl = self._build_ephemeris_table(init_jd, n_days + 1)
+        except swe.Error as e:
+            raise RuntimeError(f"Грешка при изчисляване на ефемеридите за {start_date} - {end_date}: {e}")
+
+        # Ретроградни станции и INGRES събития (общи за всички) - векторно върху таблиците.
+        # Крайното сортиране е стабилно, така че редът спрямо дневните детектори не се променя.
+        self._detect_retrograde_stations(date_strs, lon_tbl, spd_tbl, events)
+        self._detect_ingresses(date_strs, lon_tbl, events)
+
+        # Транзити за User и за Partner (ако е предоставена карта) - също за целия период
+        for target, chart in (("User", natal_chart), ("Partner", partner_chart)):
+            if not chart:
+                continue
+            natal_names, natal_lons = self._natal_targets(chart)
+            house_cusps, house_labels = self._house_cusps(chart)
             self._detect_transits_to_natal(
-                current_date, natal_chart, events, target="User"
+                date_strs, lon_tbl, natal_names, natal_lons, house_cusps, house_labels, events,
+                target=target,
             )
 
-            # Откриване на транзити за Partner (ако е предоставена карта)
-            if partner_chart:
-                self._detect_transits_to_natal(
-                    current_date, partner_chart, events, target="Partner"
-                )
-
-            current_date += timedelta(days=1)
+        # Затъмненията в периода се търсят веднъж. Всеки ден проверява "следващото
+        # затъмнение след предишния ден" в тези таблици (init_jd е jd - 1 за първия ден).
+        last_jd = init_jd + n_days - 1
+        solar_eclipse_jds = self._find_eclipses(
+            lambda jd: swe.sol_eclipse_when_loc(jd, (lon, lat, 0), swe.FLG_SWIEPH)[1][0],
+            init_jd, last_jd,
+        )
+        lunar_eclipse_jds = self._find_eclipses(
+            lambda jd: swe.lun_eclipse_when(jd, swe.FLG_SWIEPH, 0)[1][0],
+            init_jd, last_jd,
+        )
+
+        # Итерация през всеки ден - всяка стъпка е точно едно денонощие, т.е. JD + 1
+        for day_idx in range(1, n_days + 1):
+            # Откриване на лунации и затъмнения (общи за всички)
+            self._detect_lunations_and_eclipses(
+                date_strs[day_idx], day_ordinals[day_idx], init_jd + day_idx, day_idx, lon_tbl,
+                solar_eclipse_jds, lunar_eclipse_jds, events,
+            )
 
-        # Сортиране по дата (и вторично по тип за стабилност)
-        events.sort(key=lambda x: (x.get("date", ""), x.get("type", "")))
+        # Сортиране по дата (и вторично по тип за стабилност) - всички детектори задават двете полета
+        events.sort(key=itemgetter("date", "type"))
 
         return events
 
@@ -3,9 +3,16 @@
 Изтегля необходимите .se1 файлове от https://www.astro.com/ftp/swisseph/ephe/
 """
 
+import hashlib
 import os
+import shutil
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Optional
 
 # URL база за ефемеридите
 EPHE_BASE_URL = "https://www.astro.com/ftp/swisseph/ephe"
@@ -17,44 +24,117 @@ REQUIRED_FILES = {
     "seas_18.se1": "Астероиди"
 }
 
+# SHA-256 на файловете (същите като в ephe/ на репото) - засича прекъснато или повредено изтегляне
+EXPECTED_SHA256 = {
+    "sepl_18.se1": "0b7e416e3c1be9e6a0dd1d711dae7f7685793a0e7df13f76363a493dc27b6ea1",
+    "semo_18.se1": "ecfa54dbf5bc0b5a9bc3e04ed28629a821e98625eacae38f4070593bba0e2980",
+    "seas_18.se1": "0afe3f94769b6718082411c2c4fb06bf9d1aaa6c0bc1bad8f8b8725421ef8748",
+}
+
+# Обща сесия: keep-alive връзките към astro.com се преизползват между файловете.
+# .se1 файловете са двоични и не се компресират - "identity" спестява gzip от сървъра.
+# Пулът побира по една връзка за всеки паралелно изтеглян файл.
+SESSION = requests.Session()
+SESSION.headers["Accept-Encoding"] = "identity"
+SESSION.mount("https://", HTTPAdapter(pool_connections=len(REQUIRED_FILES), pool_maxsize=len(REQUIRED_FILES)))
+SESSION.mount("http://", HTTPAdapter(pool_connections=len(REQUIRED_FILES), pool_maxsize=len(REQUIRED_FILES)))
+
+# Прогресът се печата най-много веднъж на толкова секунди
+PROGRESS_INTERVAL = 0.5
+
+# Файловете се теглят паралелно - редовете от различните нишки не трябва да се смесват
+_print_lock = threading.Lock()
+
 
-def download_file(url: str, filepath: Path, chunk_size: int = 8192) -> bool:
+def _log(message: str) -> None:
+    """Печата цял ред под _print_lock"""
+    with _print_lock:
+        print(message, flush=True)
+
+
+class _ProgressWriter:
+    """Обвивка на файл за shutil.copyfileobj, която следи изтеглените байтове и печата прогрес"""
+    
+    def __init__(self, f, name: str, total_size: int):
+        self._f = f
+        self.name = name
+        self.total_size = total_size
+        self.downloaded = 0
+        self._printed = -1
+        self._last_print = 0.0
+    
+    def write(self, data: bytes) -> int:
+        written = self._f.write(data)
+        self.downloaded += len(data)
+        now = time.monotonic()
+        if now - self._last_print >= PROGRESS_INTERVAL:
+            self._last_print = now
+            self.print_progress()
+        return written
+    
+    def print_progress(self) -> None:
+        # Без повторение на последния ред, ако нищо не е изтеглено оттогава
+        if self.total_size > 0 and self._printed != self.downloaded:
+            self._printed = self.downloaded
+            percent = (self.downloaded / self.total_size) * 100
+            _log(f"  {self.name}: {percent:.1f}% ({self.downloaded}/{self.total_size} bytes)")
+
+
+def file_sha256(filepath: Path) -> str:
+    """SHA-256 (hex) на файл, прочетен на блокове"""
+    with open(filepath, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def download_file(
+    url: str,
+    filepath: Path,
+    chunk_size: int = 1024 * 1024,
+    expected_sha256: Optional[str] = None,
+) -> bool:
     """
     Изтегля файл от URL и показва прогрес.
     
     Args:
         url: URL адрес на файла
         filepath: Път към целевия файл
-        chunk_size: Размер на chunk-а за изтегляне
+        chunk_size: Размер на блока при копиране към файла
+        expected_sha256: Ако е зададен, изтегленият файл се проверява и при разлика се изтрива
         
     Returns:
         True ако изтеглянето е успешно, False иначе
     """
     try:
-        print(f"Изтегляне на {filepath.name}...")
-        response = requests.get(url, stream=True, timeout=30)
-        response.raise_for_status()
-        
-        total_size = int(response.headers.get('content-length', 0))
-        downloaded = 0
+        _log(f"Изтегляне на {filepath.name}...")
+        # with връща keep-alive връзката в пула на SESSION след изтеглянето
+        with SESSION.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            # Суровият поток не декомпресира сам (gzip/deflate) - иначе на диска отиват компресирани байтове
+            response.raw.decode_content = True
+            
+            total_size = int(response.headers.get('content-length', 0))
+            
+            with open(filepath, 'wb') as f:
+                writer = _ProgressWriter(f, filepath.name, total_size)
+                shutil.copyfileobj(response.raw, writer, length=chunk_size)
+                writer.print_progress()
         
-        with open(filepath, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size > 0:
-                        percent = (downloaded / total_size) * 100
-                        print(f"\rПрогрес: {percent:.1f}% ({downloaded}/{total_size} bytes)", end='', flush=True)
+        if expected_sha256 and file_sha256(filepath) != expected_sha256:
+            raise ValueError("SHA-256 не съвпада с очаквания")
         
-        print(f"\n✓ Успешно изтеглен {filepath.name}")
+        _log(f"✓ Успешно изтеглен {filepath.name}")
         return True
         
     except requests.exceptions.RequestException as e:
-        print(f"\n✗ Грешка при изтегляне на {filepath.name}: {e}")
+        _log(f"✗ Грешка при изтегляне на {filepath.name}: {e}")
         return False
     except Exception as e:
-        print(f"\n✗ Неочаквана грешка при изтегляне на {filepath.name}: {e}")
+        _log(f"✗ Неочаквана грешка при изтегляне на {filepath.name}: {e}")
         if filepath.exists():
             filepath.unlink()  # Изтриване на частично изтегления файл
         return False
@@ -96,23 +176,35 @@ def download_ephemeris_files(base_dir: Path = None) -> bool:
     print("Автоматично изтегляне на Swiss Ephemeris файлове")
     print("=" * 60)
     
-    all_success = True
+    missing_files = []
     
     for filename, description in REQUIRED_FILES.items():
         filepath = ephe_dir / filename
         
-        # Проверка дали файлът вече съществува
+        # Проверка дали файлът вече съществува и е цял (напр. не е от прекъснато изтегляне)
         if filepath.exists():
             file_size = filepath.stat().st_size
-            print(f"✓ {filename} вече съществува ({file_size:,} bytes) - пропускане")
-            continue
-        
-        # Изтегляне на файла
-        url = f"{EPHE_BASE_URL}/{filename}"
-        success = download_file(url, filepath)
+            if file_sha256(filepath) == EXPECTED_SHA256[filename]:
+                print(f"✓ {filename} вече съществува ({file_size:,} bytes) - пропускане")
+                continue
+            print(f"⚠ {filename} съществува ({file_size:,} bytes), но SHA-256 не съвпада - изтегляне отново")
         
-        if not success:
-            all_success = False
+        missing_files.append(filepath)
+    
+    # Изтегляне на липсващите файлове паралелно - времето е почти изцяло чакане по мрежата
+    all_success = True
+    if missing_files:
+        with ThreadPoolExecutor(max_workers=len(missing_files)) as executor:
+            futures = [
+                executor.submit(
+                    download_file,
+                    f"{EPHE_BASE_URL}/{filepath.name}",
+                    filepath,
+                    expected_sha256=EXPECTED_SHA256[filepath.name],
+                )
+                for filepath in missing_files
+            ]
+            all_success = all([future.result() for future in as_completed(futures)])
     
     print("=" * 60)
     if all_success: